@@ -100,6 +100,7 @@ For more information, visit: https://github.com/Ponsriram/rpi-simple-debugger
     import uvicorn
 
     from .config import DebuggerSettings, load_settings
+    from .server import fast_uvicorn_options
 
     # Load settings from file or create from CLI args
     if args.config:
@@ -107,22 +108,24 @@ For more information, visit: https://github.com/Ponsriram/rpi-simple-debugger
     else:
         settings = DebuggerSettings()
 
-    # Apply CLI overrides
+    # Apply CLI overrides (settings are frozen, so collect them into a copy)
+    overrides: dict = {}
     if args.no_gpio:
-        settings.gpio_enabled = False
+        overrides["gpio_enabled"] = False
     if args.no_wifi:
-        settings.wifi_enabled = False
+        overrides["wifi_enabled"] = False
     if args.no_bluetooth:
-        settings.bluetooth_enabled = False
+        overrides["bluetooth_enabled"] = False
     if args.no_system:
-        settings.system_health_enabled = False
+        overrides["system_health_enabled"] = False
     if args.gpio_backend != "auto":
-        settings.gpio_backend = args.gpio_backend
+        overrides["gpio_backend"] = args.gpio_backend
     if args.gpio_interval != 0.1:
-        settings.gpio_poll_interval_s = args.gpio_interval
+        overrides["gpio_poll_interval_s"] = args.gpio_interval
+    if overrides:
+        settings = settings.model_copy(update=overrides)
 
     # Store settings in environment for the app factory
-    import json
     import os
 
     os.environ["_RPI_DEBUGGER_SETTINGS"] = settings.model_dump_json()
@@ -132,6 +135,9 @@ For more information, visit: https://github.com/Ponsriram/rpi-simple-debugger
     print(f"   WiFi: {'enabled' if settings.wifi_enabled else 'disabled'}")
     print(f"   Bluetooth: {'enabled' if settings.bluetooth_enabled else 'disabled'}")
     print(f"   System Health: {'enabled' if settings.system_health_enabled else 'disabled'}")
+
+    uvicorn_options = fast_uvicorn_options()
+    print(f"   Event loop: {uvicorn_options['loop']} | HTTP parser: {uvicorn_options['http']}")
     print()
 
     # Run uvicorn
@@ -142,6 +148,11 @@ For more information, visit: https://github.com/Ponsriram/rpi-simple-debugger
         port=args.port,
         reload=args.reload,
         log_level="info",
+        ws_per_message_deflate=settings.ws_per_message_deflate,
+        ws_max_size=settings.ws_max_size_bytes,
+        ws_ping_interval=settings.ws_ping_interval_s,
+        ws_ping_timeout=settings.ws_ping_timeout_s,
+        **uvicorn_options,
     )
 
     return 0
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from .config import DebuggerSettings, load_settings
 from .engine import DebuggerEngine
 from .gpio_backend import GPIOBackendError
-from .gpio_monitor import GPIOMonitor
-from .models import DebuggerMessage, GPIOState, NetInterfaceStats, SystemHealth, WiFiStatus, BluetoothStatus
-from .network_monitor import NetworkMonitor
-from .system_monitor import SystemMonitor
+
+if TYPE_CHECKING:
+    from .gpio_monitor import GPIOMonitor
+    from .network_monitor import NetworkMonitor
+    from .system_monitor import SystemMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -22,69 +24,58 @@ logger = logging.getLogger(__name__)
 def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
     settings = settings or load_settings()
 
-    app = FastAPI(title="rpi-simple-debugger", version="0.1.0")
-
-    # Add CORS middleware if enabled (for web dashboards)
-    if settings.cors_enabled:
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=settings.cors_origins,
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
-
     engine = DebuggerEngine(settings=settings, version="0.1.0")
-    app.state.engine = engine
 
-    # Monitors - use configurable GPIO pins
-    gpio_monitor: GPIOMonitor | None = None
+    # Derived settings are rebuilt on every property access, so resolve them
+    # once here instead of in monitor callbacks and request handlers.
     monitored_pins = settings.effective_gpio_pins
-    if settings.gpio_enabled:
+    gpio_label_map = settings.gpio_label_map
+    analog_label_map = settings.analog_label_map
+    output_pins = frozenset(settings.gpio_output_pins or ())
 
-        def on_gpio_change(state: GPIOState) -> None:
-            engine.update_gpio(state)
+    # Monitors - use configurable GPIO pins. Each monitor module is imported
+    # only when its subsystem is enabled, so disabled features (and psutil)
+    # are never loaded.
+    gpio_monitor: GPIOMonitor | None = None
+    if settings.gpio_enabled:
+        from .gpio_monitor import GPIOMonitor
 
         try:
             gpio_monitor = GPIOMonitor(
                 pins=monitored_pins,
-                label_map=settings.gpio_label_map,
+                label_map=gpio_label_map,
                 interval_s=settings.gpio_poll_interval_s,
-                on_change=on_gpio_change,
+                on_change=engine.update_gpio,
                 backend=settings.gpio_backend,
+                max_interval_s=settings.gpio_max_poll_interval_s,
             )
             # Populate gpio_schema with monitored pins
-            engine.set_gpio_schema(monitored_pins, settings.gpio_label_map)
+            engine.set_gpio_schema(monitored_pins, gpio_label_map)
         except GPIOBackendError as exc:
             logger.error("GPIO monitoring disabled: %s", exc)
             gpio_monitor = None
 
-    def on_wifi(status: WiFiStatus) -> None:
-        engine.update_wifi(status)
-
-    def on_bt(status: BluetoothStatus) -> None:
-        engine.update_bluetooth(status)
-
-    def on_interfaces(interfaces: List[NetInterfaceStats]) -> None:
-        engine.update_interfaces(interfaces)
-
-    def on_system(health: SystemHealth) -> None:
-        engine.update_system(health)
-
+    # Monitors call the engine's bound update methods directly rather than
+    # going through one-line forwarding closures.
     network_monitor: NetworkMonitor | None = None
     if settings.wifi_enabled or settings.bluetooth_enabled:
+        from .network_monitor import NetworkMonitor
+
         network_monitor = NetworkMonitor(
             interval_s=settings.network_poll_interval_s,
-            on_wifi=on_wifi,
-            on_bt=on_bt,
-            on_interfaces=on_interfaces,
+            on_wifi=engine.update_wifi,
+            on_bt=engine.update_bluetooth,
+            on_interfaces=engine.update_interfaces,
+            max_interval_s=settings.network_max_poll_interval_s,
         )
 
     system_monitor: SystemMonitor | None = None
     if settings.system_health_enabled:
+        from .system_monitor import SystemMonitor
+
         system_monitor = SystemMonitor(
             interval_s=settings.system_poll_interval_s,
-            on_update=on_system,
+            on_update=engine.update_system,
         )
 
     # ----- GPIO Output Controller -----
@@ -105,8 +96,6 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
             logger.error("GPIO output disabled: %s", exc)
             output_backend = None
 
-    app.state.output_backend = output_backend
-
     # ----- Analog Input Monitor -----
     analog_backend = None
     if settings.analog_enabled and settings.analog_channels:
@@ -130,41 +119,58 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
             logger.error("Analog input disabled: %s", exc)
             analog_backend = None
 
-    app.state.analog_backend = analog_backend
+    monitors = [
+        monitor
+        for monitor in (gpio_monitor, network_monitor, system_monitor)
+        if monitor is not None
+    ]
 
-    @app.on_event("startup")
-    async def _startup() -> None:  # pragma: no cover - integration behavior
-        if gpio_monitor is not None:
-            gpio_monitor.start()
-        if network_monitor is not None:
-            network_monitor.start()
-        if system_monitor is not None:
-            system_monitor.start()
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:  # pragma: no cover
+        await engine.start()
+        for monitor in monitors:
+            monitor.start()
 
         # Send an initial meta broadcast so connected clients quickly
         # understand capabilities.
         await engine.send_meta()
 
-    @app.on_event("shutdown")
-    async def _shutdown() -> None:  # pragma: no cover - integration behavior
-        if gpio_monitor is not None:
-            gpio_monitor.stop()
-        if network_monitor is not None:
-            network_monitor.stop()
-        if system_monitor is not None:
-            system_monitor.stop()
+        yield
+
+        # stop() joins each monitor thread, which can take up to one poll
+        # interval, so stop them in parallel rather than one after another.
+        await asyncio.gather(*(asyncio.to_thread(m.stop) for m in monitors))
         if output_backend is not None:
             output_backend.cleanup()
         if analog_backend is not None:
             analog_backend.cleanup()
+        await engine.stop()
+
+    app = FastAPI(title="rpi-simple-debugger", version="0.1.0", lifespan=lifespan)
+    app.state.engine = engine
+    app.state.output_backend = output_backend
+    app.state.analog_backend = analog_backend
+
+    # Add CORS middleware if enabled (for web dashboards)
+    if settings.cors_enabled:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     @app.get("/status")
-    async def get_status() -> JSONResponse:
+    async def get_status() -> Response:
         """Return the most recent snapshot for easy polling UIs."""
 
-        snapshot = app.state.engine.snapshot
-        # Ensure datetimes and other non-JSON-native types are encoded.
-        return JSONResponse(snapshot.model_dump(mode="json"))
+        # The engine keeps the snapshot already encoded as JSON; send those
+        # bytes as-is instead of dumping and re-encoding via JSONResponse.
+        return Response(
+            content=app.state.engine.snapshot_json(),
+            media_type="application/json",
+        )
 
     @app.post("/gpio/{pin}")
     async def set_gpio_output(pin: int, value: int) -> JSONResponse:
@@ -174,7 +180,7 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
                 {"error": "GPIO output is not configured or unavailable."},
                 status_code=503,
             )
-        if settings.gpio_output_pins and pin not in settings.gpio_output_pins:
+        if output_pins and pin not in output_pins:
             return JSONResponse(
                 {"error": f"Pin {pin} is not configured as an output pin."},
                 status_code=400,
@@ -199,7 +205,6 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
                 status_code=503,
             )
         readings = {}
-        label_map = settings.analog_label_map
         for ch in settings.analog_channels or []:
             try:
                 raw = analog_backend.read_raw(ch)
@@ -207,7 +212,7 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
                 from .models import AnalogReading
                 reading = AnalogReading(
                     channel=ch, raw=raw, voltage=round(voltage, 4),
-                    label=label_map.get(ch),
+                    label=analog_label_map.get(ch),
                 )
                 readings[ch] = reading.model_dump(mode="json")
                 engine.update_analog(reading)
@@ -219,18 +224,14 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
     async def websocket_endpoint(websocket: WebSocket) -> None:  # pragma: no cover
         engine_instance: DebuggerEngine = app.state.engine
         manager = engine_instance.manager
-        await manager.connect(websocket)
-
-        # Send current snapshot immediately so new clients have full state
-        try:
-            snapshot_data = engine_instance.snapshot.model_dump(mode="json")
-            await websocket.send_json({
-                "type": "snapshot",
-                "data": snapshot_data,
-            })
-        except Exception:
-            manager.disconnect(websocket)
-            return
+        # Queue the current snapshot as the client's first frame so new
+        # clients have full state before any update. The cached snapshot
+        # encoding is spliced into the envelope instead of dumping and
+        # re-encoding the whole snapshot for every client.
+        snapshot_frame = (
+            '{"type":"snapshot","data":' + engine_instance.snapshot_json() + "}"
+        )
+        await manager.connect(websocket, first_frame=snapshot_frame)
 
         try:
             # Handle incoming messages (for heartbeat ping-pong)
@@ -238,7 +239,7 @@ def create_app(settings: DebuggerSettings | None = None) -> FastAPI:
                 message = await websocket.receive_text()
                 # Respond to ping with pong for connection health monitoring
                 if message == "ping":
-                    await websocket.send_text("pong")
+                    manager.send_text(websocket, "pong")
         except WebSocketDisconnect:
             manager.disconnect(websocket)
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GPIOLabel(BaseModel):
@@ -17,6 +18,11 @@ class AnalogChannelLabel(BaseModel):
 
 
 class DebuggerSettings(BaseModel):
+    # Settings are read from many threads once the app is running; freezing
+    # them rules out surprises from late mutation. Use ``model_copy(update=...)``
+    # to derive a modified copy.
+    model_config = ConfigDict(frozen=True)
+
     gpio_enabled: bool = True
     wifi_enabled: bool = True
     bluetooth_enabled: bool = True
@@ -25,6 +31,38 @@ class DebuggerSettings(BaseModel):
     gpio_poll_interval_s: float = 0.1
     network_poll_interval_s: float = 2.0
     system_poll_interval_s: float = 2.0
+    gpio_max_poll_interval_s: Optional[float] = Field(
+        None,
+        description=(
+            "Upper bound for GPIO polling back-off. When set, the interval "
+            "doubles (up to this value) while no pin changes and snaps back to "
+            "gpio_poll_interval_s on the next change. None keeps a fixed interval."
+        ),
+    )
+    network_max_poll_interval_s: Optional[float] = Field(
+        None,
+        description=(
+            "Upper bound for network polling back-off while WiFi/Bluetooth "
+            "status stays the same. None keeps a fixed interval."
+        ),
+    )
+    gpio_coalesce_window_s: float = Field(
+        0.03,
+        description=(
+            "Window in seconds over which rapid GPIO changes are merged so only "
+            "the latest state per pin is broadcast. Only GPIO updates wait for "
+            "it; other messages are sent as soon as the event loop is free. "
+            "Use 0 to send GPIO changes immediately as well."
+        ),
+    )
+    gpio_batch_messages: bool = Field(
+        False,
+        description=(
+            "Send the GPIO changes merged in one coalescing window as a single "
+            "'gpio_batch' message whose data is a list of pin states, instead "
+            "of one 'gpio' message per pin."
+        ),
+    )
 
     gpio_labels: List[GPIOLabel] = Field(default_factory=list)
     gpio_pins: Optional[List[int]] = Field(
@@ -91,6 +129,30 @@ class DebuggerSettings(BaseModel):
         description="WiFi signal threshold in dBm. Below this, wifi_poor=True.",
     )
 
+    # WebSocket transport settings (passed to uvicorn)
+    ws_per_message_deflate: bool = Field(
+        True,
+        description=(
+            "Enable permessage-deflate compression. Broadcast JSON is very "
+            "repetitive and compresses well; disable to save CPU on slow boards."
+        ),
+    )
+    ws_max_size_bytes: int = Field(
+        1024 * 1024,
+        description="Largest WebSocket message accepted from clients, in bytes.",
+    )
+    ws_ping_interval_s: Optional[float] = Field(
+        20.0,
+        description=(
+            "Interval between protocol-level WebSocket pings sent by the "
+            "server, in seconds. Set to null to disable."
+        ),
+    )
+    ws_ping_timeout_s: Optional[float] = Field(
+        20.0,
+        description="Seconds to wait for a pong before closing the connection.",
+    )
+
     # CORS settings for web dashboards
     cors_enabled: bool = Field(
         True,
@@ -129,13 +191,32 @@ def load_settings(path: Optional[Path] = None) -> DebuggerSettings:
 
     This keeps configuration simple for beginners while still allowing
     customization when needed.
-    """
 
-    import json
+    The returned instance is cached and shared by every caller that loads
+    the same file. Frozen settings reject attribute assignment, but list
+    fields such as ``gpio_pins`` and ``cors_origins`` can still be mutated
+    in place; don't. Use ``settings.model_copy(update=...)`` to change them.
+    """
 
     target = path or DEFAULT_CONFIG_PATH
     if target.is_file():
-        data = json.loads(target.read_text())
-        return DebuggerSettings.model_validate(data)
+        # Settings are frozen, so a parsed file can be shared until it is
+        # modified; the modification time and size are part of the cache key.
+        stat = target.stat()
+        return _load_settings_file(
+            str(target.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+
+    return _default_settings()
+
+
+@lru_cache(maxsize=8)
+def _load_settings_file(path: str, mtime_ns: int, size: int) -> DebuggerSettings:
+    # Parse and validate in one pass with pydantic-core's JSON parser
+    # rather than building an intermediate dict with the json module.
+    return DebuggerSettings.model_validate_json(Path(path).read_bytes())
+
 
+@lru_cache(maxsize=1)
+def _default_settings() -> DebuggerSettings:
     return DebuggerSettings()
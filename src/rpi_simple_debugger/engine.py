@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import platform
+import queue
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union, get_args
 
 from fastapi import WebSocket
+from pydantic import BaseModel
 
 from .config import DebuggerSettings
 from .models import (
@@ -19,34 +23,107 @@ from .models import (
     GPIOPinDefinition,
     GPIOState,
     HealthSummary,
+    MessageType,
     NetInterfaceStats,
     SystemHealth,
     WiFiStatus,
 )
 
 
+# Pre-encoded ``{"type":...,"data":`` prefix for every message type, so hot
+# paths can splice an already-encoded payload into the envelope without
+# building a DebuggerMessage and a wrapper dict.
+_ENVELOPE_PREFIX: Dict[str, str] = {
+    message_type: '{"type":"' + message_type + '","data":'
+    for message_type in get_args(MessageType)
+}
+
+
 class ConnectionManager:
+    """Tracks connected websockets and fans out broadcast messages.
+
+    Each client gets a bounded outbound queue drained by its own writer task,
+    so a slow client only delays (and eventually loses) its own frames
+    instead of holding up every other connection.
+    """
+
+    # Frames buffered per client before the oldest ones are dropped.
+    _QUEUE_SIZE = 256
+
     def __init__(self) -> None:
-        self._active: List[WebSocket] = []
+        self._active: Dict[WebSocket, asyncio.Queue[Dict[str, Any]]] = {}
+        self._writers: Dict[WebSocket, asyncio.Task[None]] = {}
 
-    async def connect(self, websocket: WebSocket) -> None:
+    @property
+    def client_count(self) -> int:
+        """Number of currently connected websocket clients."""
+        return len(self._active)
+
+    async def connect(
+        self, websocket: WebSocket, first_frame: Optional[str] = None
+    ) -> None:
+        """Accept ``websocket`` and start its writer task.
+
+        ``first_frame`` (e.g. the snapshot) is queued before the writer
+        starts and before the client can receive broadcasts, so it is always
+        the first frame the client sees. Every send to the socket goes
+        through the writer.
+        """
         await websocket.accept()
-        self._active.append(websocket)
+        client_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(
+            maxsize=self._QUEUE_SIZE
+        )
+        if first_frame is not None:
+            client_queue.put_nowait({"type": "websocket.send", "text": first_frame})
+        self._active[websocket] = client_queue
+        self._writers[websocket] = asyncio.create_task(
+            self._writer(websocket, client_queue)
+        )
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self._active:
-            self._active.remove(websocket)
+        writer = self._discard(websocket)
+        if writer is not None:
+            writer.cancel()
 
     async def broadcast(self, message: DebuggerMessage) -> None:
-        to_remove: List[WebSocket] = []
-        payload = message.model_dump(mode="json")
-        for ws in self._active:
-            try:
-                await ws.send_json(payload)
-            except Exception:
-                to_remove.append(ws)
-        for ws in to_remove:
-            self.disconnect(ws)
+        # Serialize once and share the text frame with every client instead
+        # of letting ``send_json`` re-encode the same payload per socket.
+        await self.broadcast_text(message.model_dump_json())
+
+    async def broadcast_text(self, text: str) -> None:
+        """Broadcast an already JSON-encoded message to every client."""
+
+        # Build the ASGI send event once too; it is read-only downstream, so
+        # every client can be handed the same dict.
+        frame = {"type": "websocket.send", "text": text}
+        for client_queue in self._active.values():
+            if client_queue.full():
+                # Drop the oldest frame for clients that are falling behind.
+                client_queue.get_nowait()
+            client_queue.put_nowait(frame)
+
+    def send_text(self, websocket: WebSocket, text: str) -> None:
+        """Queue a text frame for one client (e.g. a heartbeat reply)."""
+        client_queue = self._active.get(websocket)
+        if client_queue is None:
+            return
+        if client_queue.full():
+            client_queue.get_nowait()
+        client_queue.put_nowait({"type": "websocket.send", "text": text})
+
+    async def _writer(
+        self, websocket: WebSocket, client_queue: asyncio.Queue[Dict[str, Any]]
+    ) -> None:
+        try:
+            while True:
+                frame = await client_queue.get()
+                await websocket.send(frame)
+        except Exception:
+            self._discard(websocket)
+
+    def _discard(self, websocket: WebSocket) -> Optional[asyncio.Task[None]]:
+        self._active.pop(websocket, None)
+        return self._writers.pop(websocket, None)
 
 
 class DebuggerEngine:
@@ -56,10 +133,37 @@ class DebuggerEngine:
     broadcast websocket messages.
     """
 
+    # Message types produced by polling monitors; an update whose content
+    # matches the previous broadcast for the same key is skipped. Custom
+    # pushes are always sent since apps may use them as heartbeats.
+    _DEDUPED_TYPES = frozenset({"gpio", "wifi", "bluetooth", "system"})
+
     def __init__(self, settings: DebuggerSettings, version: str) -> None:
         self.settings = settings
         self.manager = ConnectionManager()
-        self._loop = asyncio.get_event_loop()
+        # Bound in ``start`` to the loop the app actually runs on; calling
+        # get_event_loop() here could pick up (or create) a different loop.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Monitors run in their own threads; they only append to this queue
+        # and one task on the event loop drains it (see ``start``).
+        self._outbox: queue.SimpleQueue[Tuple[Hashable, MessageType, Any]] = (
+            queue.SimpleQueue()
+        )
+        self._outbox_ready: Optional[asyncio.Event] = None
+        # True while a wake-up for the drain task is already on its way, so
+        # a burst of updates costs one cross-thread call instead of one each.
+        self._wake_pending = False
+        # True once a GPIO update is queued; only then does the drain task
+        # wait out ``gpio_coalesce_window_s`` before sending.
+        self._gpio_pending = False
+        # Gives every custom push its own outbox key, so pushes under one
+        # name are never merged and each one is delivered.
+        self._custom_seq = itertools.count()
+        self._drain_task: Optional[asyncio.Task[None]] = None
+        # Last broadcast data per key (minus its timestamp) for monitor
+        # updates, so repeated identical readings are not re-sent.
+        self._last_sent: Dict[Hashable, Dict[str, Any]] = {}
 
         app_info = AppInfo(
             debugger_version=version,
@@ -70,6 +174,15 @@ class DebuggerEngine:
             app=app_info,
             board=self._detect_board(),
         )
+        # Bumped on every snapshot mutation; the cached encoding is only
+        # reused while its version still matches.
+        self._snapshot_version = 0
+        self._snapshot_json: Optional[Tuple[int, str]] = None
+        # Meta fields other than the timestamp only change with the GPIO
+        # schema, so they are dumped once and reused by ``send_meta``.
+        self._meta_base: Optional[Dict[str, Any]] = None
+        # Readings the health flags were last computed from.
+        self._last_health_inputs: Optional[Tuple[Optional[float], ...]] = None
 
     # ----- Snapshot access -----
 
@@ -77,46 +190,60 @@ class DebuggerEngine:
     def snapshot(self) -> DebuggerSnapshot:
         return self._snapshot
 
+    def snapshot_json(self) -> str:
+        """Return the snapshot encoded as JSON.
+
+        The encoding is cached until the next update, so polling clients and
+        newly connected websockets do not re-serialize an unchanged snapshot.
+        """
+        version = self._snapshot_version
+        cached = self._snapshot_json
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        text = self._snapshot.model_dump_json()
+        self._snapshot_json = (version, text)
+        return text
+
     # ----- Update methods used by monitors -----
 
     def update_gpio(self, state: GPIOState) -> None:
         self._snapshot.gpio[state.pin] = state
-        self._schedule_broadcast(
-            DebuggerMessage(type="gpio", data=state.model_dump(mode="json"))
-        )
+        self._invalidate_snapshot()
+        self._schedule_broadcast(("gpio", state.pin), "gpio", state)
 
     def update_wifi(self, status: WiFiStatus) -> None:
         self._snapshot.wifi = status
         self._update_health_summary()
-        self._schedule_broadcast(
-            DebuggerMessage(type="wifi", data=status.model_dump(mode="json"))
-        )
+        self._invalidate_snapshot()
+        self._schedule_broadcast("wifi", "wifi", status)
 
     def update_bluetooth(self, status: BluetoothStatus) -> None:
         self._snapshot.bluetooth = status
-        self._schedule_broadcast(
-            DebuggerMessage(type="bluetooth", data=status.model_dump(mode="json"))
-        )
+        self._invalidate_snapshot()
+        self._schedule_broadcast("bluetooth", "bluetooth", status)
 
     def update_system(self, health: SystemHealth) -> None:
         self._snapshot.system = health
         self._update_health_summary()
-        self._schedule_broadcast(
-            DebuggerMessage(type="system", data=health.model_dump(mode="json"))
-        )
+        self._invalidate_snapshot()
+        self._schedule_broadcast("system", "system", health)
 
     def update_interfaces(self, interfaces: List[NetInterfaceStats]) -> None:
         self._snapshot.interfaces = interfaces
+        self._invalidate_snapshot()
         # No separate broadcast for interfaces - they're part of the snapshot
 
     def update_analog(self, reading: AnalogReading) -> None:
         self._snapshot.analog[reading.channel] = reading
+        self._invalidate_snapshot()
         self._schedule_broadcast(
-            DebuggerMessage(type="custom", data={
+            ("analog", reading.channel),
+            "custom",
+            {
                 "name": "analog",
                 "channel": reading.channel,
                 **reading.model_dump(mode="json"),
-            })
+            },
         )
 
     def set_gpio_schema(self, pins: List[int], label_map: Dict[int, str]) -> None:
@@ -128,85 +255,198 @@ class DebuggerEngine:
                 mode="in",
                 pull="none",
             )
+        self._meta_base = None
+        self._invalidate_snapshot()
 
     def push_custom(self, name: str, payload: Dict[str, Any]) -> None:
         entry = CustomEntry(name=name, payload=payload)
         self._snapshot.custom[name] = entry
+        self._invalidate_snapshot()
         self._schedule_broadcast(
-            DebuggerMessage(type="custom", data=entry.model_dump(mode="json"))
+            ("custom", name, next(self._custom_seq)), "custom", entry
         )
 
+    # ----- Lifecycle -----
+
+    async def start(self) -> None:
+        """Start delivering queued updates on the running event loop."""
+
+        self._loop = asyncio.get_running_loop()
+        self._outbox_ready = asyncio.Event()
+        self._wake_pending = False
+        self._drain_task = asyncio.create_task(self._drain_outbox())
+
+    async def stop(self) -> None:
+        """Stop delivering updates; later updates only refresh the snapshot."""
+
+        task, self._drain_task = self._drain_task, None
+        self._outbox_ready = None
+        self._loop = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
     async def send_meta(self) -> None:
         """Broadcast current meta information (board + app + time)."""
 
-        meta: Dict[str, Any] = {
-            "board": (
-                self._snapshot.board.model_dump(mode="json")
-                if self._snapshot.board
-                else None
-            ),
-            "app": self._snapshot.app.model_dump(mode="json"),
-            "timestamp": datetime.utcnow().isoformat(),
-            "enabled": {
-                "gpio": self.settings.gpio_enabled,
-                "wifi": self.settings.wifi_enabled,
-                "bluetooth": self.settings.bluetooth_enabled,
-                "system_health": self.settings.system_health_enabled,
-            },
-            "gpio_schema": {
-                pin: defn.model_dump(mode="json")
-                for pin, defn in self._snapshot.gpio_schema.items()
-            },
-        }
+        if self._meta_base is None:
+            self._meta_base = {
+                "board": (
+                    self._snapshot.board.model_dump(mode="json")
+                    if self._snapshot.board
+                    else None
+                ),
+                "app": self._snapshot.app.model_dump(mode="json"),
+                "enabled": {
+                    "gpio": self.settings.gpio_enabled,
+                    "wifi": self.settings.wifi_enabled,
+                    "bluetooth": self.settings.bluetooth_enabled,
+                    "system_health": self.settings.system_health_enabled,
+                },
+                "gpio_schema": {
+                    pin: defn.model_dump(mode="json")
+                    for pin, defn in self._snapshot.gpio_schema.items()
+                },
+            }
+        meta = dict(self._meta_base, timestamp=datetime.utcnow().isoformat())
         await self.manager.broadcast(DebuggerMessage(type="meta", data=meta))
 
     # ----- Internal helpers -----
 
-    def _schedule_broadcast(self, message: DebuggerMessage) -> None:
-        asyncio.run_coroutine_threadsafe(self.manager.broadcast(message), self._loop)
+    def _schedule_broadcast(
+        self,
+        key: Hashable,
+        message_type: MessageType,
+        payload: Union[BaseModel, Dict[str, Any]],
+    ) -> None:
+        """Queue an update for broadcast; safe to call from monitor threads.
+
+        ``key`` identifies what the update describes (e.g. ``("gpio", 17)``).
+        Updates with the same key that are still queued when the loop drains
+        the outbox are merged, and only the latest one is sent. Callers that
+        need every update delivered (custom pushes) use unique keys.
+        """
+        ready = self._outbox_ready
+        loop = self._loop
+        if ready is None or loop is None:
+            # Not started yet (or already stopped): nobody to deliver to.
+            return
+        if not self.manager.client_count:
+            # Idle device: the snapshot is already updated and new clients
+            # receive it on connect. Forget what was last sent for this key so
+            # the next update after someone connects is never deduplicated
+            # against a state they never saw.
+            self._last_sent.pop(key, None)
+            return
+        if message_type == "gpio":
+            self._gpio_pending = True
+        self._outbox.put((key, message_type, payload))
+        if not self._wake_pending:
+            self._wake_pending = True
+            loop.call_soon_threadsafe(ready.set)
+
+    async def _drain_outbox(self) -> None:
+        ready = self._outbox_ready
+        assert ready is not None
+        while True:
+            await ready.wait()
+            window = self.settings.gpio_coalesce_window_s
+            if window > 0 and self._gpio_pending:
+                # Let GPIO bursts (e.g. a bouncing button) accumulate before
+                # sending; other updates go out as soon as the loop is free.
+                await asyncio.sleep(window)
+            ready.clear()
+            # Reset before draining: anything queued after this point either
+            # gets drained below or schedules a fresh wake-up.
+            self._wake_pending = False
+            self._gpio_pending = False
+
+            latest: Dict[Hashable, Tuple[MessageType, Any]] = {}
+            while True:
+                try:
+                    key, message_type, payload = self._outbox.get_nowait()
+                except queue.Empty:
+                    break
+                latest[key] = (message_type, payload)
+
+            batch_gpio = self.settings.gpio_batch_messages
+            gpio_batch: List[str] = []
+            for key, (message_type, payload) in latest.items():
+                if not isinstance(payload, BaseModel):
+                    await self.manager.broadcast(
+                        DebuggerMessage(type=message_type, data=payload)
+                    )
+                    continue
+                if message_type in self._DEDUPED_TYPES:
+                    content = payload.model_dump(exclude={"timestamp"})
+                    if self._last_sent.get(key) == content:
+                        continue
+                    self._last_sent[key] = content
+                data_json = payload.model_dump_json()
+                if batch_gpio and message_type == "gpio":
+                    gpio_batch.append(data_json)
+                    continue
+                await self.manager.broadcast_text(
+                    _ENVELOPE_PREFIX[message_type] + data_json + "}"
+                )
+
+            if gpio_batch:
+                await self.manager.broadcast_text(
+                    _ENVELOPE_PREFIX["gpio_batch"] + "[" + ",".join(gpio_batch) + "]}"
+                )
+
+    def _invalidate_snapshot(self) -> None:
+        self._snapshot_version += 1
 
     def _update_health_summary(self) -> None:
         """Recompute health flags based on current snapshot data and configured thresholds."""
+        system = self._snapshot.system
+        wifi = self._snapshot.wifi
+        inputs = (
+            system.cpu_temp_c if system else None,
+            system.disk_used_percent if system else None,
+            system.memory_percent if system else None,
+            wifi.signal_level_dbm if wifi else None,
+        )
+        # Most ticks leave the watched readings unchanged; skip the rebuild.
+        if inputs == self._last_health_inputs:
+            return
+        self._last_health_inputs = inputs
+        cpu_temp, disk_used, memory, signal = inputs
+
         health = HealthSummary()
 
         # CPU temperature check (configurable threshold)
-        if self._snapshot.system and self._snapshot.system.cpu_temp_c is not None:
-            health.cpu_hot = (
-                self._snapshot.system.cpu_temp_c > self.settings.cpu_temp_threshold_c
-            )
+        if cpu_temp is not None:
+            health.cpu_hot = cpu_temp > self.settings.cpu_temp_threshold_c
 
         # Disk usage check (configurable threshold)
-        if self._snapshot.system:
-            health.disk_low = (
-                self._snapshot.system.disk_used_percent
-                > self.settings.disk_usage_threshold_percent
-            )
+        if disk_used is not None:
+            health.disk_low = disk_used > self.settings.disk_usage_threshold_percent
 
         # Memory usage check (configurable threshold)
-        if self._snapshot.system and self._snapshot.system.memory_percent is not None:
-            health.memory_high = (
-                self._snapshot.system.memory_percent
-                > self.settings.memory_usage_threshold_percent
-            )
+        if memory is not None:
+            health.memory_high = memory > self.settings.memory_usage_threshold_percent
 
         # WiFi signal check (configurable threshold)
-        if self._snapshot.wifi and self._snapshot.wifi.signal_level_dbm is not None:
-            health.wifi_poor = (
-                self._snapshot.wifi.signal_level_dbm
-                < self.settings.wifi_signal_threshold_dbm
-            )
+        if signal is not None:
+            health.wifi_poor = signal < self.settings.wifi_signal_threshold_dbm
 
         self._snapshot.health = health
 
     def _detect_board(self) -> Optional[BoardInfo]:
-        # Keep this intentionally lightweight and best-effort.
+        # Keep this intentionally lightweight and best-effort. This runs once
+        # per engine: platform.processor() may spawn a subprocess, and the
+        # result is reused by the snapshot and the cached meta fields.
         try:
-            import platform
-
+            uname = platform.uname()
             return BoardInfo(
-                name=platform.machine(),
+                name=uname.machine,
                 cpu_arch=platform.processor() or None,
-                os=f"{platform.system()} {platform.release()}",
+                os=f"{uname.system} {uname.release}",
             )
         except Exception:
             return None
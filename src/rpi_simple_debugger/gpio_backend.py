@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Literal, Protocol
+import os
+import select
+from typing import Any, Dict, List, Literal, Protocol
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,12 @@ class GPIOBackend(Protocol):
 
     This keeps the rest of the codebase independent from any particular
     Raspberry Pi library and lets advanced users plug in their own backend.
+
+    Backends may also provide ``wait_for_edge(timeout_s) -> bool``, which
+    blocks until an input pin changes or the timeout expires, ``wake()``,
+    which makes a blocked ``wait_for_edge`` return early (called from another
+    thread on shutdown), and ``read_many(pins) -> Dict[int, int]``, which
+    reads several pins at once. The GPIO monitor uses them when present.
     """
 
     def setup_input(
@@ -45,6 +53,9 @@ class MockGPIOBackend:
     def read(self, pin: int) -> int:
         return 0
 
+    def read_many(self, pins: List[int]) -> Dict[int, int]:
+        return dict.fromkeys(pins, 0)
+
     def cleanup(self) -> None:
         return
 
@@ -160,6 +171,7 @@ class LibgpiodBackend:
     def __init__(self, chip_path: str = "/dev/gpiochip0") -> None:
         self._chip_path = chip_path
         self._lines: Dict[int, Any] = {}  # offset -> gpiod.Line
+        self._event_lines: Dict[int, Any] = {}  # event fd -> gpiod.Line
         self._chip: Any = None
 
         try:
@@ -179,6 +191,12 @@ class LibgpiodBackend:
                 "or adding your user to the 'gpio' group)."
             ) from exc
 
+        # Self-pipe that wake() writes to, so a wait_for_edge blocked in
+        # select() returns as soon as the monitor is asked to stop.
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
     def setup_input(
         self,
         pin: int,
@@ -186,6 +204,7 @@ class LibgpiodBackend:
     ) -> None:
         # Release existing line if reconfiguring
         if pin in self._lines:
+            self._forget_event_line(self._lines[pin])
             self._lines[pin].release()
 
         line = self._chip.get_line(pin)
@@ -201,7 +220,18 @@ class LibgpiodBackend:
             # Older libgpiod without bias support — ignore pull config
             pass
 
-        line.request(consumer="rpi-debugger", type=self._gpiod.LINE_REQ_DIR_IN, flags=flags)
+        # Ask for edge events so the monitor can sleep until a pin actually
+        # changes. Lines whose chip cannot raise edge interrupts are requested
+        # as plain inputs and picked up by the monitor's regular polling.
+        try:
+            line.request(
+                consumer="rpi-debugger",
+                type=self._gpiod.LINE_REQ_EV_BOTH_EDGES,
+                flags=flags,
+            )
+            self._event_lines[line.event_get_fd()] = line
+        except Exception:
+            line.request(consumer="rpi-debugger", type=self._gpiod.LINE_REQ_DIR_IN, flags=flags)
         self._lines[pin] = line
 
     def read(self, pin: int) -> int:
@@ -212,7 +242,50 @@ class LibgpiodBackend:
             )
         return self._lines[pin].get_value()
 
+    def wait_for_edge(self, timeout_s: float) -> bool:
+        """Block until an input line reports an edge or ``timeout_s`` passes.
+
+        Returns ``True`` if at least one edge event was received. Pending
+        events are consumed; callers re-read the pins to get current values.
+        Also returns early (with ``False``) once ``wake()`` is called.
+        """
+        # Without edge-capable lines this is just an interruptible sleep.
+        ready, _, _ = select.select(
+            [self._wake_r, *self._event_lines], [], [], timeout_s
+        )
+        edge = False
+        for fd in ready:
+            if fd == self._wake_r:
+                try:
+                    os.read(self._wake_r, 64)
+                except OSError:
+                    pass
+                continue
+            line = self._event_lines.get(fd)
+            if line is None:
+                continue
+            edge = True
+            try:
+                line.event_read_multiple()
+            except Exception:
+                pass
+        return edge
+
+    def wake(self) -> None:
+        """Make a blocked (or the next) ``wait_for_edge`` return at once."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            # Pipe already full (a wake-up is pending) or closed by cleanup().
+            pass
+
+    def _forget_event_line(self, line: Any) -> None:
+        for fd, event_line in list(self._event_lines.items()):
+            if event_line is line:
+                del self._event_lines[fd]
+
     def cleanup(self) -> None:
+        self._event_lines.clear()
         for line in self._lines.values():
             try:
                 line.release()
@@ -224,6 +297,13 @@ class LibgpiodBackend:
                 self._chip.close()
             except Exception:
                 pass
+        # Closed last: after cleanup() a late wake() is a harmless no-op.
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = -1
 
 
 # ---------------------------------------------------------------------------
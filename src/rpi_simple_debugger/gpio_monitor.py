@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import threading
-import time
+from datetime import datetime
 from typing import Callable, Dict, List, Optional
 
 from .gpio_backend import (
@@ -18,10 +18,21 @@ from .models import GPIOState
 class GPIOMonitor:
     """Polls GPIO pins and reports changes via a callback.
 
-    This uses simple polling instead of interrupts so it behaves
-    consistently across boards and is easier to explain to beginners.
+    Pins are read with simple polling so the monitor behaves consistently
+    across boards. When the backend offers ``wait_for_edge`` (libgpiod), the
+    wait between polls ends as soon as a pin changes, so changes are reported
+    immediately rather than on the next tick.
+
+    When ``max_interval_s`` is given, the poll interval doubles after every
+    few polls without a change (up to that ceiling) and drops back to
+    ``interval_s`` as soon as a pin changes.
     """
 
+    # Unchanged polls needed before the interval is doubled.
+    _BACKOFF_AFTER_POLLS = 5
+    # How long stop() waits for the poll thread before handing it cleanup.
+    _STOP_JOIN_TIMEOUT_S = 1.0
+
     def __init__(
         self,
         pins: List[int],
@@ -29,13 +40,21 @@ class GPIOMonitor:
         interval_s: float,
         on_change: Callable[[GPIOState], None],
         backend: str = "auto",
+        max_interval_s: Optional[float] = None,
     ) -> None:
         self._pins = pins
         self._label_map = label_map
         self._interval_s = interval_s
+        self._max_interval_s = max_interval_s
+        self._current_interval_s = interval_s
         self._on_change = on_change
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        # Guards the hand-off of backend cleanup between stop() and a loop
+        # that is still inside a backend call when stop() gives up waiting.
+        self._cleanup_lock = threading.Lock()
+        self._loop_running = False
+        self._cleanup_pending = False
         self._last_values: Dict[int, int] = {}
         self._backend = self._create_backend(backend)
 
@@ -90,27 +109,86 @@ class GPIOMonitor:
             self._backend.setup_input(pin)
 
         self._stop.clear()
-        self._thread = threading.Thread(target=self._loop, daemon=True)
+        with self._cleanup_lock:
+            self._loop_running = True
+            self._cleanup_pending = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop.set()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1)
+        # Interrupt a backend blocked in wait_for_edge instead of waiting
+        # out the (possibly backed-off) poll interval.
+        wake = getattr(self._backend, "wake", None)
+        if wake is not None:
+            wake()
+        if self._thread is not None:
+            self._thread.join(timeout=self._STOP_JOIN_TIMEOUT_S)
+        with self._cleanup_lock:
+            if self._loop_running:
+                # The loop is still using the backend; it cleans up itself
+                # as soon as its current call returns.
+                self._cleanup_pending = True
+                return
         self._backend.cleanup()
 
+    def _run(self) -> None:
+        try:
+            self._loop()
+        finally:
+            with self._cleanup_lock:
+                self._loop_running = False
+                cleanup = self._cleanup_pending
+                self._cleanup_pending = False
+            if cleanup:
+                self._backend.cleanup()
+
     def _loop(self) -> None:
+        wait_for_edge = getattr(self._backend, "wait_for_edge", None)
+        read_many = getattr(self._backend, "read_many", None)
+        self._current_interval_s = self._interval_s
+        idle_polls = 0
         while not self._stop.is_set():
-            for pin in self._pins:
-                value = self._backend.read(pin)
-                last = self._last_values.get(pin)
-                if last is None or last != value:
+            if read_many is not None:
+                values = read_many(self._pins)
+            else:
+                values = {pin: self._backend.read(pin) for pin in self._pins}
+
+            # A single dict comparison covers the common all-unchanged case;
+            # only walk the pins when something actually differs.
+            changed = values != self._last_values
+            if changed:
+                # Pins that changed in the same poll share one timestamp.
+                now = datetime.utcnow()
+                for pin, value in values.items():
+                    if self._last_values.get(pin) == value:
+                        continue
                     self._last_values[pin] = value
+                    # Every field is produced here from trusted values, so
+                    # skip pydantic validation on this per-change hot path.
                     self._on_change(
-                        GPIOState(
+                        GPIOState.model_construct(
                             pin=pin,
                             value=int(value),
                             label=self._label_map.get(pin),
+                            timestamp=now,
                         )
                     )
-            time.sleep(self._interval_s)
+
+            if changed or self._max_interval_s is None:
+                idle_polls = 0
+                self._current_interval_s = self._interval_s
+            else:
+                idle_polls += 1
+                if idle_polls >= self._BACKOFF_AFTER_POLLS:
+                    idle_polls = 0
+                    self._current_interval_s = max(
+                        self._interval_s,
+                        min(self._current_interval_s * 2, self._max_interval_s),
+                    )
+            if wait_for_edge is not None:
+                # Returns early on an edge or when stop() calls wake().
+                wait_for_edge(self._current_interval_s)
+            else:
+                # Returns early when stop() is called.
+                self._stop.wait(self._current_interval_s)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -117,6 +117,13 @@ class DebuggerSnapshot(BaseModel):
     app: AppInfo
 
 
+MessageType = Literal[
+    "gpio", "gpio_batch", "wifi", "bluetooth", "system", "custom", "meta"
+]
+
+
 class DebuggerMessage(BaseModel):
-    type: Literal["gpio", "wifi", "bluetooth", "system", "custom", "meta"]
-    data: Dict[str, Any]
+    type: MessageType
+    # ``gpio_batch`` frames carry a list of GPIO states; every other type
+    # carries a single object.
+    data: Union[Dict[str, Any], List[Dict[str, Any]]]
@@ -1,29 +1,82 @@
 from __future__ import annotations
 
+import array
+import re
+import shutil
+import socket
+import struct
 import subprocess
 import threading
 import time
-from typing import Callable, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import psutil
 
 from .models import NetInterfaceStats, WiFiStatus, BluetoothStatus
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Kernel wireless statistics, one line per wireless interface.
+_PROC_NET_WIRELESS = Path("/proc/net/wireless")
+# Wireless-extensions ioctl returning the ESSID of an interface.
+_SIOCGIWESSID = 0x8B1B
+_IW_ESSID_MAX_SIZE = 32
+# struct iwreq: interface name followed by a struct iw_point
+# (buffer pointer, length, flags); the kernel reads a 32-byte request.
+_IWREQ_FORMAT = "16sPHH"
+_IWREQ_SIZE = 32
+# One directory per network interface, each with an ``operstate`` file.
+_SYS_CLASS_NET = Path("/sys/class/net")
+
+# iwconfig output: ESSID:"network" (or ESSID:off/any) and Signal level=-60 dBm
+_ESSID_RE = re.compile(rb'ESSID:(?:"([^"]*)"|(\S+))')
+_SIGNAL_RE = re.compile(rb"Signal level=(-?\d+)(?!\S)")
+
 
 class NetworkMonitor:
+    # Polls with unchanged WiFi/Bluetooth status before the interval doubles.
+    _BACKOFF_AFTER_POLLS = 5
+    # How long interface up/down flags from psutil.net_if_stats() are reused.
+    # That call walks every interface with several ioctls, while the flags
+    # rarely change; a change in the set of interfaces refreshes them early.
+    _IF_STATS_TTL_S = 30.0
+    # How long a tool missing from PATH is skipped before looking it up
+    # again, so a later install (e.g. of bluez) is eventually picked up.
+    _MISSING_COMMAND_RECHECK_S = 300.0
+    # Upper bound on how long the IP from `hostname -I` is reused while no
+    # interface changes operstate and the SSID stays the same (catches e.g.
+    # a DHCP lease renumbering).
+    _IP_RECHECK_S = 60.0
+
     def __init__(
         self,
         interval_s: float,
         on_wifi: Callable[[WiFiStatus], None],
         on_bt: Callable[[BluetoothStatus], None],
         on_interfaces: Callable[[List[NetInterfaceStats]], None] | None = None,
+        max_interval_s: Optional[float] = None,
     ) -> None:
         self._interval_s = interval_s
+        self._max_interval_s = max_interval_s
+        self._current_interval_s = interval_s
         self._on_wifi = on_wifi
         self._on_bt = on_bt
         self._on_interfaces = on_interfaces
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._if_up: Dict[str, bool] = {}
+        # Absolute path of each external tool (None if missing) and the
+        # monotonic time it was resolved.
+        self._command_paths: Dict[str, Tuple[Optional[str], float]] = {}
+        self._if_up_at = 0.0
+        self._last_ip: Optional[str] = None
+        self._last_operstate: Optional[Tuple[Tuple[str, bytes], ...]] = None
+        self._last_ssid: Optional[str] = None
+        self._last_ip_at = 0.0
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -38,80 +91,217 @@ class NetworkMonitor:
             self._thread.join(timeout=1)
 
     def _loop(self) -> None:
+        self._current_interval_s = self._interval_s
+        idle_polls = 0
+        last_state: Optional[tuple] = None
         while not self._stop.is_set():
-            self._on_wifi(self._get_wifi_status())
-            self._on_bt(self._get_bt_status())
+            wifi = self._get_wifi_status()
+            bt = self._get_bt_status()
+            self._on_wifi(wifi)
+            self._on_bt(bt)
             if self._on_interfaces is not None:
                 self._on_interfaces(self._get_interface_stats())
-            time.sleep(self._interval_s)
 
-    def _run_command(self, *args: str) -> str:
+            # Interface counters always move, so only WiFi/Bluetooth status
+            # decides whether the network looks idle enough to back off.
+            state = (
+                wifi.model_dump(exclude={"timestamp"}),
+                bt.model_dump(exclude={"timestamp"}),
+            )
+            if state != last_state or self._max_interval_s is None:
+                idle_polls = 0
+                self._current_interval_s = self._interval_s
+            else:
+                idle_polls += 1
+                if idle_polls >= self._BACKOFF_AFTER_POLLS:
+                    idle_polls = 0
+                    self._current_interval_s = max(
+                        self._interval_s,
+                        min(self._current_interval_s * 2, self._max_interval_s),
+                    )
+            last_state = state
+            # Returns early when stop() is called.
+            self._stop.wait(self._current_interval_s)
+
+    def _run_command(self, *args: str) -> bytes:
+        # Raw output: most callers only look for ASCII markers, so decoding
+        # is left to the few places that need text.
+        name, *rest = args
+        path = self._command_path(name)
+        if path is None:
+            # Known to be absent: don't pay for a spawn that fails with ENOENT.
+            return b""
+        # An absolute executable path with close_fds=False lets CPython use
+        # posix_spawn instead of fork+exec, which avoids copying the page
+        # tables of the whole server process on every poll. Our own file
+        # descriptors are non-inheritable by default, so none leak.
         try:
-            out = subprocess.check_output(args, stderr=subprocess.DEVNULL)
-            return out.decode().strip()
+            return subprocess.check_output(
+                [path, *rest],
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except OSError:
+            # The tool was removed or moved since it was found; look it up
+            # again next time instead of failing on the cached path forever.
+            self._command_paths.pop(name, None)
+            return b""
         except Exception:
-            return ""
+            return b""
 
-    def _get_wifi_status(self) -> WiFiStatus:
-        # Uses common Raspberry Pi tools if available; falls back gracefully.
-        iw = self._run_command("iwconfig")
-        ssid: Optional[str] = None
-        signal: Optional[int] = None
-        if "ESSID" in iw:
-            for line in iw.splitlines():
-                if "ESSID" in line:
-                    # ESSID:"network"
-                    if "ESSID:" in line:
-                        ssid_part = line.split("ESSID:")[-1].strip()
-                        ssid = ssid_part.strip('"') if ssid_part else None
-                if "Signal level" in line:
-                    # Signal level=-60 dBm
-                    for chunk in line.split():
-                        if chunk.startswith("level="):
-                            try:
-                                signal = int(chunk.split("=")[-1])
-                            except ValueError:
-                                pass
+    def _command_path(self, name: str) -> Optional[str]:
+        cached = self._command_paths.get(name)
+        now = time.monotonic()
+        if cached is not None and (
+            cached[0] is not None
+            or now - cached[1] < self._MISSING_COMMAND_RECHECK_S
+        ):
+            return cached[0]
+        path = shutil.which(name)
+        self._command_paths[name] = (path, now)
+        return path
 
-        ip_addr = None
-        ip_output = self._run_command("hostname", "-I")
-        if ip_output:
-            ip_addr = ip_output.split()[0]
+    def _get_wifi_status(self) -> WiFiStatus:
+        # Read SSID and signal straight from the kernel when possible; fall
+        # back to the common Raspberry Pi tools (iwconfig) otherwise.
+        kernel = self._read_wifi_from_kernel()
+        if kernel is not None:
+            ssid, signal = kernel
+        else:
+            ssid, signal = self._read_wifi_from_iwconfig()
 
+        ip_addr = self._get_ip_address(ssid)
         connected = ssid is not None and ssid != "off/any"
-        return WiFiStatus(
+        # Statuses are built from already-typed values on every poll, so
+        # construct them without re-running pydantic validation.
+        return WiFiStatus.model_construct(
             connected=connected,
             ssid=ssid,
             ip_address=ip_addr,
             signal_level_dbm=signal,
         )
 
+    def _get_ip_address(self, ssid: Optional[str]) -> Optional[str]:
+        # The primary address rarely changes, so only spawn `hostname -I`
+        # again once an interface goes up or down, the WiFi network changes
+        # (roaming keeps the link up but usually means a new lease), or the
+        # cache is old.
+        operstate = self._read_operstate()
+        now = time.monotonic()
+        if (
+            operstate is not None
+            and operstate == self._last_operstate
+            and ssid == self._last_ssid
+            and now - self._last_ip_at < self._IP_RECHECK_S
+        ):
+            return self._last_ip
+
+        ip_addr = None
+        ip_output = self._run_command("hostname", "-I").split()
+        if ip_output:
+            ip_addr = ip_output[0].decode("ascii", "replace")
+        self._last_ip = ip_addr
+        self._last_operstate = operstate
+        self._last_ssid = ssid
+        self._last_ip_at = now
+        return ip_addr
+
+    def _read_operstate(self) -> Optional[Tuple[Tuple[str, bytes], ...]]:
+        """Return ``(interface, operstate)`` pairs, or None without sysfs."""
+
+        try:
+            return tuple(
+                (path.parent.name, path.read_bytes().strip())
+                for path in sorted(_SYS_CLASS_NET.glob("*/operstate"))
+            )
+        except OSError:
+            return None
+
+    def _read_wifi_from_kernel(self) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """Return ``(ssid, signal_dbm)`` without spawning a process.
+
+        Uses ``/proc/net/wireless`` for the interface and signal level and
+        the ``SIOCGIWESSID`` ioctl for the SSID. Returns ``None`` when either
+        is unavailable so the caller can fall back to ``iwconfig``.
+        """
+        if fcntl is None:
+            return None
+        try:
+            lines = _PROC_NET_WIRELESS.read_text().splitlines()
+        except OSError:
+            return None
+
+        # The first two lines are column headers.
+        for line in lines[2:]:
+            name, sep, rest = line.partition(":")
+            if not sep:
+                continue
+            iface = name.strip()
+            try:
+                ssid = self._read_essid(iface)
+            except OSError:
+                return None
+            if ssid is None:
+                # Not associated; iwconfig reports no signal level either.
+                return None, None
+
+            signal: Optional[int] = None
+            fields = rest.split()  # status, link, level, noise, ...
+            if len(fields) >= 3:
+                try:
+                    signal = int(float(fields[2]))
+                except ValueError:
+                    pass
+            return ssid, signal
+        return None
+
+    def _read_essid(self, iface: str) -> Optional[str]:
+        buf = array.array("B", bytes(_IW_ESSID_MAX_SIZE + 1))
+        address, size = buf.buffer_info()
+        request = struct.pack(
+            _IWREQ_FORMAT, iface.encode()[:15], address, size, 0
+        ).ljust(_IWREQ_SIZE, b"\0")
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            result = fcntl.ioctl(sock.fileno(), _SIOCGIWESSID, request)
+        length = struct.unpack_from(_IWREQ_FORMAT, result)[2]
+        essid = buf.tobytes()[: min(length, _IW_ESSID_MAX_SIZE)]
+        return essid.decode(errors="replace") or None
+
+    def _read_wifi_from_iwconfig(self) -> Tuple[Optional[str], Optional[int]]:
+        iw = self._run_command("iwconfig")
+        ssid: Optional[str] = None
+        signal: Optional[int] = None
+        essid_match = _ESSID_RE.search(iw)
+        if essid_match is not None:
+            quoted, bare = essid_match.groups()
+            ssid = (quoted if quoted is not None else bare).decode(errors="replace")
+            signal_match = _SIGNAL_RE.search(iw)
+            if signal_match is not None:
+                signal = int(signal_match.group(1))
+        return ssid, signal
+
     def _get_bt_status(self) -> BluetoothStatus:
         # Basic check via bluetoothctl if available.
         out = self._run_command("bluetoothctl", "show")
-        powered = "Powered: yes" in out
+        powered = b"Powered: yes" in out
 
         con_out = self._run_command("bluetoothctl", "info")
-        connected = "Connected: yes" in con_out
+        connected = b"Connected: yes" in con_out
 
-        return BluetoothStatus(powered=powered, connected=connected)
+        return BluetoothStatus.model_construct(powered=powered, connected=connected)
 
     def _get_interface_stats(self) -> List[NetInterfaceStats]:
         """Collect per-interface network statistics using psutil."""
         result: List[NetInterfaceStats] = []
         try:
             io_counters = psutil.net_io_counters(pernic=True)
-            if_stats = psutil.net_if_stats()
+            if_up = self._get_interface_up_flags(io_counters.keys())
 
             for name, counters in io_counters.items():
-                is_up = False
-                if name in if_stats:
-                    is_up = if_stats[name].isup
-
                 result.append(
-                    NetInterfaceStats(
+                    NetInterfaceStats.model_construct(
                         name=name,
-                        is_up=is_up,
+                        is_up=if_up.get(name, False),
                         rx_bytes=counters.bytes_recv,
                         tx_bytes=counters.bytes_sent,
                         rx_errs=counters.errin,
@@ -122,3 +312,15 @@ class NetworkMonitor:
             pass
 
         return result
+
+    def _get_interface_up_flags(self, names: Iterable[str]) -> Dict[str, bool]:
+        now = time.monotonic()
+        if (
+            now - self._if_up_at >= self._IF_STATS_TTL_S
+            or self._if_up.keys() != set(names)
+        ):
+            self._if_up = {
+                name: stats.isup for name, stats in psutil.net_if_stats().items()
+            }
+            self._if_up_at = now
+        return self._if_up
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import importlib.util
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional, TypedDict
 
 import uvicorn
 
@@ -18,6 +19,29 @@ def get_engine() -> DebuggerEngine | None:
     return _engine
 
 
+class UvicornOptions(TypedDict):
+    """``loop``/``http`` keyword arguments for ``uvicorn.run``/``uvicorn.Config``."""
+
+    loop: Literal["uvloop", "asyncio"]
+    http: Literal["httptools", "h11"]
+
+
+def fast_uvicorn_options() -> UvicornOptions:
+    """Return uvicorn ``loop``/``http`` options, preferring the fast C versions.
+
+    uvloop and httptools are optional (``pip install rpi-simple-debugger[fast]``)
+    and may not build on every board, so fall back to the pure-Python
+    implementations when they are missing.
+    """
+
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    return UvicornOptions(
+        loop="uvloop" if has_uvloop else "asyncio",
+        http="httptools" if has_httptools else "h11",
+    )
+
+
 class DebuggerHandle:
     def __init__(self, server: uvicorn.Server, thread: threading.Thread) -> None:
         self._server = server
@@ -59,7 +83,22 @@ def start_debugger_server(
     app = create_app(settings=resolved_settings)
     _engine = app.state.engine
 
-    config = uvicorn.Config(app, host=host, port=port, log_level="info")
+    # The embedded server shares its process with the user's application:
+    # skip per-request access logging (dashboards poll /status constantly)
+    # and keep idle HTTP/1.1 connections open so polls reuse them.
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        access_log=False,
+        timeout_keep_alive=75,
+        ws_per_message_deflate=resolved_settings.ws_per_message_deflate,
+        ws_max_size=resolved_settings.ws_max_size_bytes,
+        ws_ping_interval=resolved_settings.ws_ping_interval_s,
+        ws_ping_timeout=resolved_settings.ws_ping_timeout_s,
+        **fast_uvicorn_options(),
+    )
     server = uvicorn.Server(config)
 
     def _run() -> None:
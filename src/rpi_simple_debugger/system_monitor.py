@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import heapq
 import os
 import threading
 import time
+from pathlib import Path
 from typing import Callable, List, Optional
 
 import psutil
 
 from .models import ProcessInfo, SystemHealth
 
+_THERMAL_ROOT = Path("/sys/class/thermal")
+_PROC_UPTIME = Path("/proc/uptime")
+
 
 class SystemMonitor:
     def __init__(
@@ -20,6 +25,12 @@ class SystemMonitor:
         self._on_update = on_update
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        # Boot time never changes while we run, so it is read once.
+        self._boot_time: Optional[float] = None
+        # Thermal zone file for the CPU, found on the first tick. When there
+        # is none, psutil.sensors_temperatures() is used instead.
+        self._thermal_path: Optional[Path] = None
+        self._thermal_probed = False
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -36,19 +47,11 @@ class SystemMonitor:
     def _loop(self) -> None:
         while not self._stop.is_set():
             self._on_update(self._get_health())
-            time.sleep(self._interval_s)
+            # Returns early when stop() is called.
+            self._stop.wait(self._interval_s)
 
     def _get_health(self) -> SystemHealth:
-        cpu_temp = None
-        try:
-            temps = psutil.sensors_temperatures()
-            # On Raspberry Pi this is often "cpu-thermal" or similar.
-            for _name, entries in temps.items():
-                if entries:
-                    cpu_temp = entries[0].current
-                    break
-        except Exception:
-            cpu_temp = None
+        cpu_temp = self._get_cpu_temp()
 
         cpu_percent = psutil.cpu_percent(interval=None)
         disk = psutil.disk_usage("/")
@@ -70,34 +73,48 @@ class SystemMonitor:
             pass
 
         uptime_s = None
-        boot_time = None
+        boot_time = self._boot_time
+        if boot_time is None:
+            try:
+                boot_time = self._boot_time = float(psutil.boot_time())
+            except Exception:
+                pass
         try:
-            boot_time = float(psutil.boot_time())
-            uptime_s = float(time.time() - boot_time)
-        except Exception:
-            pass
+            # Seconds since boot from the kernel's monotonic clock, so a
+            # wall-clock adjustment (e.g. NTP sync after boot) can't skew it.
+            uptime_s = float(_PROC_UPTIME.read_bytes().split()[0])
+        except (OSError, ValueError, IndexError):
+            if boot_time is not None:
+                uptime_s = float(time.time() - boot_time)
 
         process_count = None
         top_processes: list[ProcessInfo] | None = None
         try:
-            procs = []
-            for p in psutil.process_iter(attrs=["pid", "name", "cpu_percent"]):
-                info = p.info
-                procs.append(
-                    ProcessInfo(
-                        pid=info.get("pid"),
-                        name=info.get("name"),
-                        cpu_percent=info.get("cpu_percent"),
-                    )
+            # process_iter reuses its cached Process objects between calls,
+            # which keeps per-process cpu_percent rolling. Only the top three
+            # become ProcessInfo models; the rest stay plain info dicts.
+            infos = [
+                p.info
+                for p in psutil.process_iter(attrs=["pid", "name", "cpu_percent"])
+            ]
+            process_count = len(infos)
+            top_processes = [
+                ProcessInfo.model_construct(
+                    pid=info.get("pid"),
+                    name=info.get("name"),
+                    cpu_percent=info.get("cpu_percent"),
                 )
-            process_count = len(procs)
-            procs.sort(key=lambda x: (x.cpu_percent or 0.0), reverse=True)
-            top_processes = procs[:3]
+                for info in heapq.nlargest(
+                    3, infos, key=lambda info: info.get("cpu_percent") or 0.0
+                )
+            ]
         except Exception:
             process_count = None
             top_processes = None
 
-        return SystemHealth(
+        # Every field above is already the declared type, so skip pydantic
+        # validation on this per-tick path.
+        return SystemHealth.model_construct(
             cpu_temp_c=cpu_temp,
             cpu_percent=float(cpu_percent),
             disk_used_percent=float(disk.percent),
@@ -111,3 +128,48 @@ class SystemMonitor:
             process_count=process_count,
             top_processes=top_processes,
         )
+
+    def _get_cpu_temp(self) -> Optional[float]:
+        if not self._thermal_probed:
+            self._thermal_probed = True
+            self._thermal_path = self._find_cpu_thermal_zone()
+
+        if self._thermal_path is not None:
+            try:
+                # Millidegrees Celsius, e.g. "48312".
+                return int(self._thermal_path.read_bytes()) / 1000.0
+            except (OSError, ValueError):
+                self._thermal_path = None
+
+        try:
+            temps = psutil.sensors_temperatures()
+            # On Raspberry Pi this is often "cpu-thermal" or similar.
+            for _name, entries in temps.items():
+                if entries:
+                    return entries[0].current
+        except Exception:
+            pass
+        return None
+
+    def _find_cpu_thermal_zone(self) -> Optional[Path]:
+        try:
+            # Numeric order, so thermal_zone2 comes before thermal_zone10.
+            zones = sorted(_THERMAL_ROOT.glob("thermal_zone*"), key=_zone_number)
+        except OSError:
+            return None
+        fallback: Optional[Path] = None
+        for zone in zones:
+            try:
+                zone_type = (zone / "type").read_text().strip().lower()
+            except OSError:
+                continue
+            if "cpu" in zone_type or "soc" in zone_type:
+                return zone / "temp"
+            if fallback is None:
+                fallback = zone / "temp"
+        return fallback
+
+
+def _zone_number(zone: Path) -> int:
+    suffix = zone.name[len("thermal_zone") :]
+    return int(suffix) if suffix.isdigit() else -1
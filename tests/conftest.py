@@ -0,0 +1,182 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rpi_simple_debugger.app import create_app
+from rpi_simple_debugger.config import DebuggerSettings
+from rpi_simple_debugger.engine import DebuggerEngine
+from rpi_simple_debugger.gpio_monitor import GPIOMonitor
+from rpi_simple_debugger.models import BluetoothStatus, SystemHealth, WiFiStatus
+from rpi_simple_debugger.network_monitor import NetworkMonitor
+from rpi_simple_debugger.system_monitor import SystemMonitor
+
+
+class _StopAfterWaits:
+    """Stand-in for a monitor's ``_stop`` event; set after ``count`` waits.
+
+    Every ``wait`` timeout is recorded in ``waits``, so a test can run a
+    monitor's ``_loop`` in its own thread and check the poll intervals
+    without sleeping.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.waits = []
+
+    def is_set(self) -> bool:
+        return len(self.waits) >= self.count
+
+    def wait(self, timeout: float) -> bool:
+        self.waits.append(timeout)
+        return self.is_set()
+
+    def set(self) -> None:
+        self.count = len(self.waits)
+
+
+@pytest.fixture(scope="module")
+def disabled_settings() -> DebuggerSettings:
+    """Settings with every monitor turned off."""
+    return DebuggerSettings(
+        gpio_enabled=False,
+        wifi_enabled=False,
+        bluetooth_enabled=False,
+        system_health_enabled=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def disabled_app(disabled_settings: DebuggerSettings) -> FastAPI:
+    """An app with no monitors running, shared by a test module."""
+    return create_app(settings=disabled_settings)
+
+
+@pytest.fixture(scope="module")
+def disabled_client(disabled_app: FastAPI):
+    """A started TestClient for ``disabled_app``; lifespan runs once per module."""
+    with TestClient(disabled_app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> DebuggerSettings:
+    """Default settings; frozen, so one instance is shared by every test."""
+    return DebuggerSettings()
+
+
+@pytest.fixture(scope="module")
+def base_engine(default_settings: DebuggerSettings) -> DebuggerEngine:
+    """An engine with default settings; only for tests that don't mutate it."""
+    return DebuggerEngine(settings=default_settings, version="0.1.0")
+
+
+@pytest.fixture
+def engine_factory(
+    default_settings: DebuggerSettings,
+    base_engine: DebuggerEngine,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Build fresh engines from settings overrides.
+
+    Each engine gets its own snapshot and queues, but reuses the board info
+    already detected for ``base_engine`` instead of probing the platform again.
+    Overrides are applied with ``model_copy`` on the shared default settings,
+    so they must already be valid values.
+    """
+    board = base_engine.snapshot.board
+    monkeypatch.setattr(DebuggerEngine, "_detect_board", lambda self: board)
+
+    def factory(**overrides) -> DebuggerEngine:
+        settings = (
+            default_settings.model_copy(update=overrides)
+            if overrides
+            else default_settings
+        )
+        return DebuggerEngine(settings=settings, version="0.1.0")
+
+    return factory
+
+
+@pytest.fixture
+def mock_gpio_monitor():
+    """Build mock-backend GPIOMonitors that are always stopped on teardown."""
+    monitors = []
+
+    def factory(
+        pins=(17,),
+        label_map=None,
+        interval_s: float = 0.05,
+        on_change=lambda s: None,
+        **kwargs,
+    ) -> GPIOMonitor:
+        monitor = GPIOMonitor(
+            pins=list(pins),
+            label_map=label_map or {},
+            interval_s=interval_s,
+            on_change=on_change,
+            backend="mock",
+            **kwargs,
+        )
+        monitors.append(monitor)
+        return monitor
+
+    yield factory
+    for monitor in monitors:
+        monitor.stop()
+
+
+@pytest.fixture
+def stop_after_waits():
+    """Build ``_stop`` stand-ins that end a monitor loop after N waits."""
+    return _StopAfterWaits
+
+
+@pytest.fixture
+def stub_collectors(monkeypatch: pytest.MonkeyPatch):
+    """Stub a network or system monitor's collectors with canned readings."""
+
+    def stub(monitor):
+        if isinstance(monitor, NetworkMonitor):
+            monkeypatch.setattr(
+                monitor, "_get_wifi_status", lambda: WiFiStatus(connected=False)
+            )
+            monkeypatch.setattr(
+                monitor,
+                "_get_bt_status",
+                lambda: BluetoothStatus(powered=False, connected=False),
+            )
+            monkeypatch.setattr(monitor, "_get_interface_stats", lambda: [])
+        elif isinstance(monitor, SystemMonitor):
+            monkeypatch.setattr(
+                monitor,
+                "_get_health",
+                lambda: SystemHealth(cpu_percent=0.0, disk_used_percent=0.0),
+            )
+        return monitor
+
+    return stub
+
+
+@pytest.fixture
+def running_monitor(request, mock_gpio_monitor, stub_collectors):
+    """A started monitor, stopped on teardown.
+
+    Parametrize indirectly with ``"gpio"`` (mock backend), ``"network"`` or
+    ``"system"``; the network and system collectors are stubbed.
+    """
+    kind = request.param
+    if kind == "gpio":
+        monitor = mock_gpio_monitor(interval_s=0.1)
+    elif kind == "network":
+        monitor = stub_collectors(
+            NetworkMonitor(interval_s=0.1, on_wifi=lambda w: None, on_bt=lambda b: None)
+        )
+    else:
+        monitor = stub_collectors(
+            SystemMonitor(interval_s=0.1, on_update=lambda h: None)
+        )
+    monitor.start()
+    yield monitor
+    monitor.stop()
@@ -12,30 +12,14 @@ def test_create_app_returns_fastapi_app() -> None:
     assert app.title == "rpi-simple-debugger"
 
 
-def test_create_app_with_custom_settings() -> None:
+def test_create_app_with_custom_settings(disabled_app) -> None:
     """create_app should accept custom settings."""
-    settings = DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    )
-    app = create_app(settings=settings)
-    assert app.title == "rpi-simple-debugger"
+    assert disabled_app.title == "rpi-simple-debugger"
 
 
-def test_status_endpoint() -> None:
+def test_status_endpoint(disabled_client) -> None:
     """GET /status should return snapshot data."""
-    settings = DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    )
-    app = create_app(settings=settings)
-
-    with TestClient(app) as client:
-        response = client.get("/status")
+    response = disabled_client.get("/status")
 
     assert response.status_code == 200
     data = response.json()
@@ -49,17 +33,9 @@ def test_status_endpoint() -> None:
     assert "health" in data
 
 
-def test_status_endpoint_app_info() -> None:
+def test_status_endpoint_app_info(disabled_client) -> None:
     """GET /status should include app version info."""
-    app = create_app(DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    ))
-
-    with TestClient(app) as client:
-        response = client.get("/status")
+    response = disabled_client.get("/status")
 
     data = response.json()
     assert data["app"]["debugger_version"] == "0.1.0"
@@ -126,17 +102,9 @@ def test_cors_disabled() -> None:
     assert response.status_code in [200, 405]
 
 
-def test_health_summary_in_status() -> None:
+def test_health_summary_in_status(disabled_client) -> None:
     """GET /status should include health summary."""
-    app = create_app(DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    ))
-
-    with TestClient(app) as client:
-        response = client.get("/status")
+    response = disabled_client.get("/status")
 
     data = response.json()
     assert "health" in data
@@ -146,40 +114,24 @@ def test_health_summary_in_status() -> None:
     assert "wifi_poor" in data["health"]
 
 
-def test_websocket_endpoint_accepts_connection() -> None:
+def test_websocket_endpoint_accepts_connection(disabled_client) -> None:
     """WebSocket /ws endpoint should accept connections."""
-    app = create_app(DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    ))
+    with disabled_client.websocket_connect("/ws") as websocket:
+        # Should receive initial snapshot
+        data = websocket.receive_json()
+        assert data["type"] == "snapshot"
+        assert "data" in data
 
-    with TestClient(app) as client:
-        with client.websocket_connect("/ws") as websocket:
-            # Should receive initial snapshot
-            data = websocket.receive_json()
-            assert data["type"] == "snapshot"
-            assert "data" in data
 
-
-def test_websocket_ping_pong() -> None:
+def test_websocket_ping_pong(disabled_client) -> None:
     """WebSocket should respond to ping with pong."""
-    app = create_app(DebuggerSettings(
-        gpio_enabled=False,
-        wifi_enabled=False,
-        bluetooth_enabled=False,
-        system_health_enabled=False,
-    ))
-
-    with TestClient(app) as client:
-        with client.websocket_connect("/ws") as websocket:
-            # Consume initial snapshot
-            websocket.receive_json()
+    with disabled_client.websocket_connect("/ws") as websocket:
+        # Consume initial snapshot
+        websocket.receive_json()
 
-            # Send ping
-            websocket.send_text("ping")
+        # Send ping
+        websocket.send_text("ping")
 
-            # Should receive pong
-            response = websocket.receive_text()
-            assert response == "pong"
+        # Should receive pong
+        response = websocket.receive_text()
+        assert response == "pong"
@@ -1,9 +1,13 @@
 """Tests for the configuration module."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from rpi_simple_debugger.config import DebuggerSettings, GPIOLabel, load_settings
 
 
@@ -96,3 +100,30 @@ def test_load_settings_from_file() -> None:
     assert settings.cpu_temp_threshold_c == 70.0
     # Unspecified settings should use defaults
     assert settings.bluetooth_enabled is True
+
+
+def test_settings_are_frozen() -> None:
+    """Settings should be immutable; overrides go through model_copy."""
+    settings = DebuggerSettings()
+
+    with pytest.raises(ValidationError):
+        settings.gpio_enabled = False  # type: ignore[misc]
+
+    updated = settings.model_copy(update={"gpio_enabled": False})
+    assert updated.gpio_enabled is False
+    assert settings.gpio_enabled is True
+
+
+def test_load_settings_reuses_unchanged_file(tmp_path) -> None:
+    """load_settings should reparse a file only after it changes."""
+    target = tmp_path / "settings.json"
+    target.write_text(json.dumps({"gpio_poll_interval_s": 0.5}))
+
+    first = load_settings(target)
+    assert load_settings(target) is first
+
+    target.write_text(json.dumps({"gpio_poll_interval_s": 0.25}))
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_settings(target).gpio_poll_interval_s == 0.25
@@ -1,33 +1,92 @@
 """Tests for the engine module."""
 
-from rpi_simple_debugger.config import DebuggerSettings
-from rpi_simple_debugger.engine import DebuggerEngine, ConnectionManager
+import asyncio
+import json
+import threading
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from rpi_simple_debugger.engine import _ENVELOPE_PREFIX, ConnectionManager
 from rpi_simple_debugger.models import (
     BluetoothStatus,
+    DebuggerMessage,
     GPIOState,
+    NetInterfaceStats,
     SystemHealth,
     WiFiStatus,
 )
 
 
-def test_engine_initialization() -> None:
-    """DebuggerEngine should initialize with default snapshot."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+def _gpio(pin: int, value: int, **kwargs) -> GPIOState:
+    """Build a GPIOState the way GPIOMonitor does, without validation."""
+    return GPIOState.model_construct(pin=pin, value=value, **kwargs)
+
+
+def _health(**kwargs) -> SystemHealth:
+    """Build a SystemHealth the way SystemMonitor does, without validation."""
+    return SystemHealth.model_construct(**kwargs)
+
+
+class _FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket used by manager tests."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send(self, message: dict) -> None:
+        if self.fail:
+            raise RuntimeError("connection closed")
+        assert message["type"] == "websocket.send"
+        self.sent.append(message["text"])
+
+
+@asynccontextmanager
+async def _running(engine, ws: _FakeWebSocket):
+    """Start ``engine`` with ``ws`` connected; disconnect and stop on exit."""
+    await engine.start()
+    await engine.manager.connect(ws)
+    try:
+        yield engine
+    finally:
+        engine.manager.disconnect(ws)
+        await engine.stop()
+
+
+async def _broadcast(manager: ConnectionManager, clients, messages) -> list:
+    """Connect ``clients``, broadcast ``messages`` and return who stayed connected."""
+    for ws in clients:
+        await manager.connect(ws)
+    for message in messages:
+        await manager.broadcast(message)
+    # Give the per-client writer tasks a chance to drain their queues.
+    await asyncio.sleep(0.01)
+    still_connected = list(manager._active)
+    for ws in clients:
+        manager.disconnect(ws)
+    await asyncio.sleep(0)
+    return still_connected
+
 
-    snapshot = engine.snapshot
+def test_engine_initialization(base_engine) -> None:
+    """DebuggerEngine should initialize with default snapshot."""
+    snapshot = base_engine.snapshot
     assert snapshot.gpio == {}
     assert snapshot.wifi is None
     assert snapshot.system is None
     assert snapshot.app.debugger_version == "0.1.0"
 
 
-def test_engine_update_gpio() -> None:
+def test_engine_update_gpio(engine_factory) -> None:
     """update_gpio should update snapshot GPIO state."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
-    state = GPIOState(pin=17, value=1, label="LED")
+    state = _gpio(17, 1, label="LED")
     engine.update_gpio(state)
 
     assert 17 in engine.snapshot.gpio
@@ -35,10 +94,9 @@ def test_engine_update_gpio() -> None:
     assert engine.snapshot.gpio[17].label == "LED"
 
 
-def test_engine_update_wifi() -> None:
+def test_engine_update_wifi(engine_factory) -> None:
     """update_wifi should update snapshot WiFi state and health."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
     status = WiFiStatus(connected=True, ssid="TestNetwork", signal_level_dbm=-60)
     engine.update_wifi(status)
@@ -48,10 +106,9 @@ def test_engine_update_wifi() -> None:
     assert engine.snapshot.health.wifi_poor is False  # -60 > -75
 
 
-def test_engine_update_wifi_poor_signal() -> None:
+def test_engine_update_wifi_poor_signal(engine_factory) -> None:
     """update_wifi should set wifi_poor flag for weak signal."""
-    settings = DebuggerSettings(wifi_signal_threshold_dbm=-70)
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory(wifi_signal_threshold_dbm=-70)
 
     status = WiFiStatus(connected=True, ssid="TestNetwork", signal_level_dbm=-80)
     engine.update_wifi(status)
@@ -59,10 +116,9 @@ def test_engine_update_wifi_poor_signal() -> None:
     assert engine.snapshot.health.wifi_poor is True
 
 
-def test_engine_update_bluetooth() -> None:
+def test_engine_update_bluetooth(engine_factory) -> None:
     """update_bluetooth should update snapshot Bluetooth state."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
     status = BluetoothStatus(powered=True, connected=False)
     engine.update_bluetooth(status)
@@ -72,12 +128,11 @@ def test_engine_update_bluetooth() -> None:
     assert engine.snapshot.bluetooth.connected is False
 
 
-def test_engine_update_system() -> None:
+def test_engine_update_system(engine_factory) -> None:
     """update_system should update snapshot and compute health flags."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
-    health = SystemHealth(
+    health = _health(
         cpu_temp_c=75.0,
         cpu_percent=50.0,
         disk_used_percent=85.0,
@@ -93,54 +148,60 @@ def test_engine_update_system() -> None:
     assert engine.snapshot.health.disk_low is False
 
 
-def test_engine_health_flags_hot_cpu() -> None:
-    """Health flags should indicate hot CPU when above threshold."""
-    settings = DebuggerSettings(cpu_temp_threshold_c=70.0)
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
-
-    health = SystemHealth(
-        cpu_temp_c=75.0,
-        cpu_percent=50.0,
-        disk_used_percent=50.0,
-    )
-    engine.update_system(health)
-
-    assert engine.snapshot.health.cpu_hot is True
+@pytest.mark.parametrize(
+    "setting_kw, health_kw, flag",
+    [
+        (
+            {"cpu_temp_threshold_c": 70.0},
+            {"cpu_temp_c": 75.0, "cpu_percent": 50.0, "disk_used_percent": 50.0},
+            "cpu_hot",
+        ),
+        (
+            {"disk_usage_threshold_percent": 80.0},
+            {"cpu_percent": 50.0, "disk_used_percent": 85.0},
+            "disk_low",
+        ),
+        (
+            {"memory_usage_threshold_percent": 80.0},
+            {"cpu_percent": 50.0, "disk_used_percent": 50.0, "memory_percent": 85.0},
+            "memory_high",
+        ),
+    ],
+    ids=["hot_cpu", "low_disk", "high_memory"],
+)
+def test_engine_health_flags(engine_factory, setting_kw, health_kw, flag) -> None:
+    """Health flags should be raised when a reading crosses its threshold."""
+    engine = engine_factory(**setting_kw)
 
+    engine.update_system(_health(**health_kw))
 
-def test_engine_health_flags_low_disk() -> None:
-    """Health flags should indicate low disk when above threshold."""
-    settings = DebuggerSettings(disk_usage_threshold_percent=80.0)
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    assert getattr(engine.snapshot.health, flag) is True
 
-    health = SystemHealth(
-        cpu_percent=50.0,
-        disk_used_percent=85.0,
-    )
-    engine.update_system(health)
 
-    assert engine.snapshot.health.disk_low is True
+def test_engine_health_flags_track_changed_readings(engine_factory) -> None:
+    """Health flags should only be rebuilt when a watched reading changes."""
+    engine = engine_factory(cpu_temp_threshold_c=70.0)
 
+    def reading(cpu_temp_c: float, cpu_percent: float) -> SystemHealth:
+        return _health(
+            cpu_temp_c=cpu_temp_c,
+            cpu_percent=cpu_percent,
+            disk_used_percent=50.0,
+        )
 
-def test_engine_health_flags_high_memory() -> None:
-    """Health flags should indicate high memory when above threshold."""
-    settings = DebuggerSettings(memory_usage_threshold_percent=80.0)
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine.update_system(reading(60.0, 10.0))
+    first = engine.snapshot.health
+    # cpu_percent is not a health input, so the flags are left as they were.
+    engine.update_system(reading(60.0, 90.0))
+    assert engine.snapshot.health is first
 
-    health = SystemHealth(
-        cpu_percent=50.0,
-        disk_used_percent=50.0,
-        memory_percent=85.0,
-    )
-    engine.update_system(health)
-
-    assert engine.snapshot.health.memory_high is True
+    engine.update_system(reading(75.0, 90.0))
+    assert engine.snapshot.health.cpu_hot is True
 
 
-def test_engine_set_gpio_schema() -> None:
+def test_engine_set_gpio_schema(engine_factory) -> None:
     """set_gpio_schema should populate gpio_schema in snapshot."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
     pins = [17, 27]
     label_map = {17: "LED", 27: "Button"}
@@ -152,10 +213,9 @@ def test_engine_set_gpio_schema() -> None:
     assert engine.snapshot.gpio_schema[27].label == "Button"
 
 
-def test_engine_push_custom() -> None:
+def test_engine_push_custom(engine_factory) -> None:
     """push_custom should add custom data to snapshot."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
     engine.push_custom("my_app", {"state": "running", "version": "1.0"})
 
@@ -163,12 +223,9 @@ def test_engine_push_custom() -> None:
     assert engine.snapshot.custom["my_app"].payload["state"] == "running"
 
 
-def test_engine_update_interfaces() -> None:
+def test_engine_update_interfaces(engine_factory) -> None:
     """update_interfaces should update snapshot interfaces."""
-    from rpi_simple_debugger.models import NetInterfaceStats
-
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+    engine = engine_factory()
 
     interfaces = [
         NetInterfaceStats(
@@ -186,14 +243,187 @@ def test_engine_update_interfaces() -> None:
     assert engine.snapshot.interfaces[0].name == "wlan0"
 
 
-def test_engine_board_detection() -> None:
-    """Engine should detect board info on initialization."""
-    settings = DebuggerSettings()
-    engine = DebuggerEngine(settings=settings, version="0.1.0")
+@pytest.mark.asyncio
+async def test_engine_binds_loop_only_when_started(engine_factory) -> None:
+    """The engine should not touch an event loop until start() runs on one."""
+    engine = engine_factory()
+    assert engine._loop is None
+
+    # Updates before start() only refresh the snapshot.
+    engine.update_gpio(_gpio(17, 1))
+    assert engine.snapshot.gpio[17].value == 1
+
+    await engine.start()
+    assert engine._loop is asyncio.get_running_loop()
+    await engine.stop()
+    assert engine._loop is None
+
+
+def test_engine_snapshot_json_is_cached_until_update(engine_factory) -> None:
+    """snapshot_json should reuse its encoding until the snapshot changes."""
+    engine = engine_factory()
+
+    first = engine.snapshot_json()
+    assert engine.snapshot_json() is first
+    assert json.loads(first) == engine.snapshot.model_dump(mode="json")
+
+    engine.push_custom("my_app", {"state": "running"})
+
+    second = engine.snapshot_json()
+    assert second is not first
+    assert json.loads(second)["custom"]["my_app"]["payload"] == {"state": "running"}
+
+
+@pytest.mark.asyncio
+async def test_engine_drains_updates_from_monitor_threads(engine_factory) -> None:
+    """Updates pushed from other threads should be broadcast by the drain task."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0), ws) as engine:
+        worker = threading.Thread(
+            target=engine.update_wifi,
+            args=(WiFiStatus(connected=True, ssid="TestNetwork"),),
+        )
+        worker.start()
+        worker.join()
+        await asyncio.sleep(0.05)
+
+    frames = [json.loads(frame) for frame in ws.sent]
+    assert [f["type"] for f in frames] == ["wifi"]
+    assert frames[0]["data"]["ssid"] == "TestNetwork"
+
+
+@pytest.mark.asyncio
+async def test_engine_skips_broadcast_without_clients(engine_factory) -> None:
+    """Updates with nobody connected should only refresh the snapshot."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0), ws) as engine:
+        engine.update_gpio(_gpio(17, 1))
+        await asyncio.sleep(0.01)
+        engine.manager.disconnect(ws)
+
+        engine.update_gpio(_gpio(17, 0))
+        assert engine._outbox.empty()
+        assert engine.snapshot.gpio[17].value == 0
+
+        # A returning client must still see the pin go back to 1, even
+        # though 1 was the last value broadcast before it left.
+        await engine.manager.connect(ws)
+        engine.update_gpio(_gpio(17, 1))
+        await asyncio.sleep(0.01)
+
+    assert [json.loads(frame)["data"]["value"] for frame in ws.sent] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_engine_sends_gpio_batch_when_enabled(engine_factory) -> None:
+    """With gpio_batch_messages, one window's GPIO changes share a single frame."""
+    ws = _FakeWebSocket()
+    engine = engine_factory(gpio_coalesce_window_s=0.02, gpio_batch_messages=True)
 
+    async with _running(engine, ws):
+        engine.update_gpio(_gpio(17, 1))
+        engine.update_gpio(_gpio(27, 0))
+        engine.update_bluetooth(BluetoothStatus(powered=True, connected=False))
+        await asyncio.sleep(0.1)
+
+    frames = [json.loads(frame) for frame in ws.sent]
+    assert [f["type"] for f in frames] == ["bluetooth", "gpio_batch"]
+    assert [(s["pin"], s["value"]) for s in frames[1]["data"]] == [(17, 1), (27, 0)]
+
+
+@pytest.mark.asyncio
+async def test_engine_wakes_drain_task_once_per_burst(engine_factory) -> None:
+    """A burst of queued updates should cost a single cross-thread wake-up."""
+    ws = _FakeWebSocket()
+    wakeups = []
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0), ws) as engine:
+        loop = engine._loop
+
+        def call_soon_threadsafe(callback):
+            wakeups.append(callback)
+            return loop.call_soon_threadsafe(callback)
+
+        engine._loop = SimpleNamespace(call_soon_threadsafe=call_soon_threadsafe)
+        for pin in (17, 27, 22):
+            engine.update_gpio(_gpio(pin, 1))
+        await asyncio.sleep(0.05)
+        engine.update_gpio(_gpio(17, 0))
+        await asyncio.sleep(0.05)
+
+    assert len(wakeups) == 2
+    assert len(ws.sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_engine_skips_unchanged_monitor_updates(engine_factory) -> None:
+    """Identical monitor readings should only be broadcast once."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0), ws) as engine:
+        for powered in (True, True, False):
+            engine.update_bluetooth(BluetoothStatus(powered=powered, connected=False))
+            await asyncio.sleep(0.01)
+
+    frames = [json.loads(frame) for frame in ws.sent]
+    assert [f["data"]["powered"] for f in frames] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_engine_send_meta_reflects_schema_changes(engine_factory) -> None:
+    """send_meta should reuse its cached fields until the GPIO schema changes."""
+    engine = engine_factory()
+    ws = _FakeWebSocket()
+
+    await engine.manager.connect(ws)
+    await engine.send_meta()
+    engine.set_gpio_schema([17], {17: "LED"})
+    await engine.send_meta()
+    await asyncio.sleep(0.01)
+    engine.manager.disconnect(ws)
+
+    first, second = (json.loads(frame) for frame in ws.sent)
+    assert first["type"] == second["type"] == "meta"
+    assert first["data"]["gpio_schema"] == {}
+    assert second["data"]["gpio_schema"]["17"]["label"] == "LED"
+    assert second["data"]["app"]["debugger_version"] == "0.1.0"
+    assert "timestamp" in second["data"]
+
+
+def test_envelope_prefix_matches_debugger_message_encoding() -> None:
+    """Spliced envelopes should be byte-identical to DebuggerMessage JSON."""
+    state = GPIOState(pin=17, value=1, label="LED")
+    spliced = _ENVELOPE_PREFIX["gpio"] + state.model_dump_json() + "}"
+    expected = DebuggerMessage(
+        type="gpio", data=state.model_dump(mode="json")
+    ).model_dump_json()
+
+    assert spliced == expected
+
+
+def test_gpio_batch_frame_validates_as_debugger_message() -> None:
+    """Batched GPIO frames should parse with the public message model."""
+    states = [GPIOState(pin=17, value=1), GPIOState(pin=27, value=0)]
+    frame = (
+        _ENVELOPE_PREFIX["gpio_batch"]
+        + "["
+        + ",".join(state.model_dump_json() for state in states)
+        + "]}"
+    )
+
+    message = DebuggerMessage.model_validate_json(frame)
+
+    assert message.type == "gpio_batch"
+    assert [item["pin"] for item in message.data] == [17, 27]
+
+
+def test_engine_board_detection(base_engine) -> None:
+    """Engine should detect board info on initialization."""
     # Board info should be populated (may vary by platform)
-    assert engine.snapshot.board is not None
-    assert engine.snapshot.board.os is not None
+    assert base_engine.snapshot.board is not None
+    assert base_engine.snapshot.board.os is not None
 
 
 def test_connection_manager_disconnect_not_connected() -> None:
@@ -205,3 +435,113 @@ def test_connection_manager_disconnect_not_connected() -> None:
         pass
 
     manager.disconnect(FakeWebSocket())  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_broadcast_serializes_once() -> None:
+    """broadcast should send the same pre-encoded JSON text to every client."""
+    manager = ConnectionManager()
+    clients = [_FakeWebSocket(), _FakeWebSocket()]
+
+    message = DebuggerMessage(type="custom", data={"name": "x", "value": 1})
+    await _broadcast(manager, clients, [message])
+
+    assert clients[0].sent == clients[1].sent
+    assert clients[0].sent[0] is clients[1].sent[0]
+    assert json.loads(clients[0].sent[0]) == {
+        "type": "custom",
+        "data": {"name": "x", "value": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_broadcast_drops_failed_clients() -> None:
+    """A client whose send fails should be disconnected without affecting others."""
+    manager = ConnectionManager()
+    good, broken = _FakeWebSocket(), _FakeWebSocket(fail=True)
+
+    still_connected = await _broadcast(
+        manager,
+        [broken, good],
+        [DebuggerMessage(type="custom", data={"name": "x"})],
+    )
+
+    assert len(good.sent) == 1
+    assert still_connected == [good]
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_drops_oldest_when_queue_full() -> None:
+    """Slow clients should keep only the newest frames once their queue is full."""
+    manager = ConnectionManager()
+    manager._QUEUE_SIZE = 2
+    ws = _FakeWebSocket()
+
+    await manager.connect(ws)
+    # Broadcast without yielding so the writer cannot drain in between.
+    for i in range(4):
+        await manager.broadcast(
+            DebuggerMessage(type="custom", data={"name": "x", "i": i})
+        )
+    await asyncio.sleep(0.01)
+    manager.disconnect(ws)
+
+    assert [json.loads(frame)["data"]["i"] for frame in ws.sent] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_sends_first_frame_before_broadcasts() -> None:
+    """The connect-time frame and replies should go through the client's writer in order."""
+    manager = ConnectionManager()
+    ws = _FakeWebSocket()
+
+    await manager.connect(ws, first_frame="snapshot")
+    await manager.broadcast_text("update")
+    manager.send_text(ws, "pong")
+    await asyncio.sleep(0.01)
+    manager.disconnect(ws)
+
+    assert ws.sent == ["snapshot", "update", "pong"]
+
+
+@pytest.mark.asyncio
+async def test_engine_coalesces_rapid_gpio_updates(engine_factory) -> None:
+    """Bursts of GPIO changes should broadcast only the latest state per pin."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0.02), ws) as engine:
+        for value in (1, 0, 1):
+            engine.update_gpio(_gpio(17, value))
+        engine.update_gpio(_gpio(27, 1))
+        await asyncio.sleep(0.1)
+
+    frames = [json.loads(frame) for frame in ws.sent]
+    assert [(f["type"], f["data"]["pin"], f["data"]["value"]) for f in frames] == [
+        ("gpio", 17, 1),
+        ("gpio", 27, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_engine_delivers_every_custom_push(engine_factory) -> None:
+    """Custom pushes under one name should never be merged away."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=0.02), ws) as engine:
+        for i in range(3):
+            engine.push_custom("events", {"i": i})
+        await asyncio.sleep(0.05)
+
+    frames = [json.loads(frame) for frame in ws.sent]
+    assert [f["data"]["payload"]["i"] for f in frames] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_engine_only_delays_gpio_updates(engine_factory) -> None:
+    """The coalescing window should not hold back non-GPIO messages."""
+    ws = _FakeWebSocket()
+
+    async with _running(engine_factory(gpio_coalesce_window_s=1.0), ws) as engine:
+        engine.update_wifi(WiFiStatus(connected=True, ssid="TestNetwork"))
+        await asyncio.sleep(0.05)
+        assert [json.loads(frame)["type"] for frame in ws.sent] == ["wifi"]
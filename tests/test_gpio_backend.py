@@ -1,6 +1,11 @@
 """Tests for the GPIO backend module."""
 
+import sys
+import threading
+import time
+
 from rpi_simple_debugger.gpio_backend import (
+    LibgpiodBackend,
     MockGPIOBackend,
     RPiGPIOBackend,
     GPIOZeroBackend,
@@ -8,18 +13,20 @@ from rpi_simple_debugger.gpio_backend import (
 
 
 def test_mock_backend_read() -> None:
-    """MockGPIOBackend should always return 0."""
+    """MockGPIOBackend should accept every pull setting and always read 0."""
     backend = MockGPIOBackend()
 
     # Setup should not raise
     backend.setup_input(17)
     backend.setup_input(18, pull="up")
     backend.setup_input(19, pull="down")
+    backend.setup_input(20, pull="none")
 
     # Read should always return 0
     assert backend.read(17) == 0
     assert backend.read(18) == 0
     assert backend.read(99) == 0
+    assert backend.read_many([17, 18]) == {17: 0, 18: 0}
 
     # Cleanup should not raise
     backend.cleanup()
@@ -59,14 +66,65 @@ def test_gpiozero_backend_graceful_fallback() -> None:
     backend.cleanup()
 
 
-def test_mock_backend_pull_configurations() -> None:
-    """MockGPIOBackend should accept all pull configurations."""
-    backend = MockGPIOBackend()
+class _FakeLine:
+    """A gpiod v1 line requested as a plain input with a fixed value."""
 
-    # All pull configurations should be accepted
-    backend.setup_input(17, pull="none")
-    backend.setup_input(18, pull="up")
-    backend.setup_input(19, pull="down")
+    def __init__(self, offset: int) -> None:
+        self.value = offset % 2
+        self.released = False
+
+    def request(self, consumer: str, type: int, flags: int = 0) -> None:
+        if type == _FakeGpiod.LINE_REQ_EV_BOTH_EDGES:
+            raise OSError("edge events not supported")
+
+    def get_value(self) -> int:
+        return self.value
+
+    def release(self) -> None:
+        self.released = True
+
+
+class _FakeGpiod:
+    """Stand-in for the gpiod v1 module."""
+
+    LINE_REQ_DIR_IN = 1
+    LINE_REQ_EV_BOTH_EDGES = 6
+
+    class Chip:
+        def __init__(self, path: str) -> None:
+            self.lines = {}
+
+        def get_line(self, offset: int) -> _FakeLine:
+            return self.lines.setdefault(offset, _FakeLine(offset))
+
+        def close(self) -> None:
+            pass
+
+
+def test_libgpiod_backend_reads_each_line(monkeypatch) -> None:
+    """Each line is read through its own request (no bulk read_many)."""
+    monkeypatch.setitem(sys.modules, "gpiod", _FakeGpiod)
+    backend = LibgpiodBackend()
+    for pin in (17, 18, 27):
+        backend.setup_input(pin)
+
+    assert not hasattr(backend, "read_many")
+    assert [backend.read(pin) for pin in (17, 18, 27)] == [1, 0, 1]
+    backend.cleanup()
+
+
+def test_libgpiod_backend_wake_interrupts_wait(monkeypatch) -> None:
+    """wake() from another thread should end a long wait_for_edge early."""
+    monkeypatch.setitem(sys.modules, "gpiod", _FakeGpiod)
+    backend = LibgpiodBackend()
+    backend.setup_input(17)
+
+    timer = threading.Timer(0.05, backend.wake)
+    timer.start()
+    started = time.monotonic()
+    assert backend.wait_for_edge(5.0) is False
+    assert time.monotonic() - started < 1.0
+    timer.join()
 
-    # Should not raise any errors
     backend.cleanup()
+    backend.wake()  # Harmless once the pipe is closed.
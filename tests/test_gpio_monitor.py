@@ -1,5 +1,10 @@
 """Tests for the GPIO monitor module."""
 
+import threading
+
+import pytest
+
+from rpi_simple_debugger.gpio_backend import MockGPIOBackend
 from rpi_simple_debugger.gpio_monitor import GPIOMonitor
 from rpi_simple_debugger.models import GPIOState
 
@@ -22,41 +27,35 @@ def test_gpio_monitor_initialization() -> None:
     assert monitor._backend is not None
 
 
-def test_gpio_monitor_explicit_mock_backend() -> None:
+def test_gpio_monitor_explicit_mock_backend(mock_gpio_monitor) -> None:
     """GPIOMonitor should use mock backend when specified."""
-    monitor = GPIOMonitor(
-        pins=[17],
-        label_map={},
-        interval_s=0.1,
-        on_change=lambda s: None,
-        backend="mock",
-    )
+    monitor = mock_gpio_monitor(interval_s=0.1)
 
-    from rpi_simple_debugger.gpio_backend import MockGPIOBackend
     assert isinstance(monitor._backend, MockGPIOBackend)
 
 
-def test_gpio_monitor_start_stop() -> None:
+@pytest.mark.slow
+def test_gpio_monitor_start_stop(mock_gpio_monitor) -> None:
     """GPIOMonitor should start and stop without errors."""
     collected = []
+    reported = threading.Event()
 
     def on_change(state: GPIOState) -> None:
         collected.append(state)
+        if len(collected) >= 2:
+            reported.set()
 
-    monitor = GPIOMonitor(
+    monitor = mock_gpio_monitor(
         pins=[17, 27],
         label_map={17: "LED"},
-        interval_s=0.05,
         on_change=on_change,
-        backend="mock",
     )
 
     # Start monitoring
     monitor.start()
 
-    # Wait for initial state collection
-    import time
-    time.sleep(0.15)
+    # Wait for the initial state of both pins
+    assert reported.wait(timeout=2.0)
 
     # Stop monitoring
     monitor.stop()
@@ -66,52 +65,35 @@ def test_gpio_monitor_start_stop() -> None:
     assert len(collected) >= 2  # At least one for each pin
 
 
-def test_gpio_monitor_double_start() -> None:
+@pytest.mark.slow
+@pytest.mark.parametrize("running_monitor", ["gpio"], indirect=True)
+def test_gpio_monitor_double_start(running_monitor) -> None:
     """Starting monitor twice should not create multiple threads."""
-    monitor = GPIOMonitor(
-        pins=[17],
-        label_map={},
-        interval_s=0.1,
-        on_change=lambda s: None,
-        backend="mock",
-    )
-
-    monitor.start()
-    thread1 = monitor._thread
+    thread = running_monitor._thread
 
-    monitor.start()  # Second start
-    thread2 = monitor._thread
+    running_monitor.start()  # Second start
 
     # Should be the same thread
-    assert thread1 is thread2
-
-    monitor.stop()
+    assert running_monitor._thread is thread
 
 
-def test_gpio_monitor_labels_in_state() -> None:
+def test_gpio_monitor_labels_in_state(mock_gpio_monitor, stop_after_waits) -> None:
     """GPIOMonitor should include labels in reported state."""
     collected = []
 
-    def on_change(state: GPIOState) -> None:
-        collected.append(state)
-
-    monitor = GPIOMonitor(
+    monitor = mock_gpio_monitor(
         pins=[17, 27],
         label_map={17: "LED", 27: "Button"},
-        interval_s=0.05,
-        on_change=on_change,
-        backend="mock",
+        on_change=collected.append,
     )
+    monitor._stop = stop_after_waits(1)
 
-    monitor.start()
-    import time
-    time.sleep(0.1)
-    monitor.stop()
+    monitor._loop()
 
-    # Find the state for pin 17
-    pin17_states = [s for s in collected if s.pin == 17]
-    assert len(pin17_states) > 0
-    assert pin17_states[0].label == "LED"
+    # Find the first state for pin 17
+    first_pin17 = next((s for s in collected if s.pin == 17), None)
+    assert first_pin17 is not None
+    assert first_pin17.label == "LED"
 
 
 def test_gpio_monitor_auto_backend_fallback() -> None:
@@ -164,3 +146,131 @@ def test_gpio_monitor_gpiozero_backend_fallback() -> None:
 
     # On machines without gpiozero, should fall back to mock
     assert monitor._backend is not None
+
+
+def test_gpio_monitor_backs_off_when_idle(mock_gpio_monitor, stop_after_waits) -> None:
+    """Poll interval should grow up to max_interval_s while pins stay unchanged."""
+    monitor = mock_gpio_monitor(interval_s=0.01, max_interval_s=0.04)
+    monitor._BACKOFF_AFTER_POLLS = 2
+    monitor._stop = stop_after_waits(7)
+
+    monitor._loop()
+
+    assert monitor._stop.waits == [0.01, 0.01, 0.02, 0.02, 0.04, 0.04, 0.04]
+
+
+def test_gpio_monitor_resets_interval_on_change(mock_gpio_monitor, stop_after_waits) -> None:
+    """A pin change should drop the poll interval back to interval_s."""
+    monitor = mock_gpio_monitor(interval_s=0.01, max_interval_s=0.04)
+    monitor._BACKOFF_AFTER_POLLS = 1
+    monitor._stop = stop_after_waits(5)
+    reads = iter([0, 0, 0, 1, 1])
+    monitor._backend.read_many = lambda pins: dict.fromkeys(pins, next(reads))
+
+    monitor._loop()
+
+    assert monitor._stop.waits == [0.01, 0.02, 0.04, 0.01, 0.02]
+
+
+def test_gpio_monitor_fixed_interval_by_default(mock_gpio_monitor, stop_after_waits) -> None:
+    """Without max_interval_s the poll interval should never change."""
+    monitor = mock_gpio_monitor(interval_s=0.01)
+    monitor._BACKOFF_AFTER_POLLS = 1
+    monitor._stop = stop_after_waits(5)
+
+    monitor._loop()
+
+    assert monitor._stop.waits == [0.01] * 5
+
+
+def test_gpio_monitor_states_have_model_defaults(mock_gpio_monitor, stop_after_waits) -> None:
+    """Unvalidated states should still carry the model defaults."""
+    collected = []
+
+    monitor = mock_gpio_monitor(pins=[17, 27], on_change=collected.append)
+    monitor._stop = stop_after_waits(1)
+
+    monitor._loop()
+
+    state = collected[0]
+    assert state.mode == "in"
+    assert state.pull == "none"
+    assert state.timestamp is not None
+    assert GPIOState.model_validate_json(state.model_dump_json()) == state
+    # Both pins changed in the first poll, so they share its timestamp.
+    assert collected[1].timestamp == state.timestamp
+
+
+def test_gpio_monitor_wakes_on_backend_edge(mock_gpio_monitor) -> None:
+    """Backends with wait_for_edge should report changes without waiting a full interval."""
+
+    class EdgeBackend(MockGPIOBackend):
+        def __init__(self) -> None:
+            self.value = 0
+            self.edge = threading.Event()
+            self.waiting = threading.Event()
+
+        def read_many(self, pins: list) -> dict:
+            return dict.fromkeys(pins, self.value)
+
+        def wait_for_edge(self, timeout_s: float) -> bool:
+            self.waiting.set()
+            fired = self.edge.wait(timeout_s)
+            self.edge.clear()
+            return fired
+
+        def wake(self) -> None:
+            self.edge.set()
+
+    changed = threading.Event()
+
+    def on_change(state: GPIOState) -> None:
+        if state.value == 1:
+            changed.set()
+
+    # Far longer than any wait below: only an edge or wake() can end it.
+    monitor = mock_gpio_monitor(interval_s=60.0, on_change=on_change)
+    backend = EdgeBackend()
+    monitor._backend = backend
+
+    monitor.start()
+    assert backend.waiting.wait(5.0)
+    backend.value = 1
+    backend.edge.set()
+    assert changed.wait(5.0)
+
+    # stop() must interrupt the 60 s wait; its join would time out otherwise.
+    monitor.stop()
+    assert not monitor._thread.is_alive()
+
+
+def test_gpio_monitor_cleans_up_after_loop_exits(mock_gpio_monitor) -> None:
+    """A loop still inside a backend call should release the backend itself."""
+    waiting = threading.Event()
+    release = threading.Event()
+    events = []
+
+    class BlockingBackend(MockGPIOBackend):
+        def wait_for_edge(self, timeout_s: float) -> bool:
+            # Ignores wake(), like a backend stuck in a slow call.
+            waiting.set()
+            release.wait(5.0)
+            events.append("wait returned")
+            return False
+
+        def cleanup(self) -> None:
+            events.append("cleanup")
+
+    monitor = mock_gpio_monitor(interval_s=60.0)
+    monitor._backend = BlockingBackend()
+    monitor._STOP_JOIN_TIMEOUT_S = 0.01
+
+    monitor.start()
+    assert waiting.wait(5.0)
+    monitor.stop()
+    # stop() gave up waiting, so it must not have released the backend.
+    assert events == []
+
+    release.set()
+    monitor._thread.join(5.0)
+    assert events == ["wait returned", "cleanup"]
@@ -1,7 +1,10 @@
 """Tests for the models module."""
 
+import json
 from datetime import datetime
 
+import pytest
+
 from rpi_simple_debugger.models import (
     BluetoothStatus,
     DebuggerSnapshot,
@@ -15,48 +18,57 @@ from rpi_simple_debugger.models import (
     AppInfo,
 )
 
+# Shared by the snapshot tests, which only read it.
+_APP_INFO = AppInfo(debugger_version="0.1.0", python_version="3.9.0")
 
-def test_gpio_state_defaults() -> None:
-    """GPIOState should have sensible defaults."""
-    state = GPIOState(pin=17, value=1)
-
-    assert state.pin == 17
-    assert state.value == 1
-    assert state.label is None
-    assert state.mode == "in"
-    assert state.pull == "none"
-    assert isinstance(state.timestamp, datetime)
-
-
-def test_gpio_state_with_label() -> None:
-    """GPIOState should accept optional label."""
-    state = GPIOState(pin=17, value=0, label="LED")
-
-    assert state.label == "LED"
 
+@pytest.mark.parametrize(
+    "kwargs, expect",
+    [
+        (
+            {"pin": 17, "value": 1},
+            {"pin": 17, "value": 1, "label": None, "mode": "in", "pull": "none"},
+        ),
+        ({"pin": 17, "value": 0, "label": "LED"}, {"label": "LED"}),
+    ],
+    ids=["defaults", "with_label"],
+)
+def test_gpio_state(kwargs, expect) -> None:
+    """GPIOState should have sensible defaults and accept an optional label."""
+    state = GPIOState(**kwargs)
 
-def test_wifi_status() -> None:
-    """WiFiStatus should capture connection info."""
-    status = WiFiStatus(
-        connected=True,
-        ssid="MyNetwork",
-        ip_address="192.168.1.42",
-        signal_level_dbm=-55,
-    )
-
-    assert status.connected is True
-    assert status.ssid == "MyNetwork"
-    assert status.ip_address == "192.168.1.42"
-    assert status.signal_level_dbm == -55
+    for field, value in expect.items():
+        assert getattr(state, field) == value
+    assert isinstance(state.timestamp, datetime)
 
 
-def test_wifi_status_disconnected() -> None:
-    """WiFiStatus should handle disconnected state."""
-    status = WiFiStatus(connected=False)
+@pytest.mark.parametrize(
+    "kwargs, expect",
+    [
+        (
+            {
+                "connected": True,
+                "ssid": "MyNetwork",
+                "ip_address": "192.168.1.42",
+                "signal_level_dbm": -55,
+            },
+            {
+                "connected": True,
+                "ssid": "MyNetwork",
+                "ip_address": "192.168.1.42",
+                "signal_level_dbm": -55,
+            },
+        ),
+        ({"connected": False}, {"connected": False, "ssid": None, "ip_address": None}),
+    ],
+    ids=["connected", "disconnected"],
+)
+def test_wifi_status(kwargs, expect) -> None:
+    """WiFiStatus should capture connection info and handle a disconnected state."""
+    status = WiFiStatus(**kwargs)
 
-    assert status.connected is False
-    assert status.ssid is None
-    assert status.ip_address is None
+    for field, value in expect.items():
+        assert getattr(status, field) == value
 
 
 def test_bluetooth_status() -> None:
@@ -143,8 +155,7 @@ def test_gpio_pin_definition() -> None:
 
 def test_debugger_snapshot() -> None:
     """DebuggerSnapshot should aggregate all state."""
-    app_info = AppInfo(debugger_version="0.1.0", python_version="3.9.0")
-    snapshot = DebuggerSnapshot(app=app_info)
+    snapshot = DebuggerSnapshot(app=_APP_INFO)
 
     assert snapshot.gpio == {}
     assert snapshot.wifi is None
@@ -157,13 +168,26 @@ def test_debugger_snapshot() -> None:
 
 def test_debugger_snapshot_serialization() -> None:
     """DebuggerSnapshot should serialize to JSON correctly."""
-    app_info = AppInfo(debugger_version="0.1.0", python_version="3.9.0")
-    snapshot = DebuggerSnapshot(app=app_info)
+    snapshot = DebuggerSnapshot(app=_APP_INFO)
     snapshot.gpio[17] = GPIOState(pin=17, value=1, label="LED")
     snapshot.wifi = WiFiStatus(connected=True, ssid="Test")
 
-    data = snapshot.model_dump(mode="json")
+    # Python mode is enough for checking structure: it skips turning
+    # datetimes and keys into strings.
+    data = snapshot.model_dump()
 
     assert "gpio" in data
-    assert "17" in data["gpio"] or 17 in data["gpio"]
+    assert 17 in data["gpio"]
     assert data["wifi"]["connected"] is True
+
+
+def test_debugger_snapshot_json_roundtrip() -> None:
+    """DebuggerSnapshot JSON should use string keys and ISO timestamps."""
+    stamp = datetime(2024, 1, 2, 3, 4, 5)
+    snapshot = DebuggerSnapshot(app=_APP_INFO)
+    snapshot.gpio[17] = GPIOState(pin=17, value=1, label="LED", timestamp=stamp)
+
+    data = json.loads(snapshot.model_dump_json())
+
+    assert data["gpio"]["17"]["timestamp"] == "2024-01-02T03:04:05"
+    assert DebuggerSnapshot.model_validate(data) == snapshot
@@ -1,21 +1,27 @@
 """Tests for the system monitor module."""
 
-from rpi_simple_debugger.system_monitor import SystemMonitor
-from rpi_simple_debugger.models import SystemHealth
+import threading
 
+import pytest
 
-def test_system_monitor_collects_health() -> None:
-    """SystemMonitor should collect system health data."""
-    collected_health = []
+from rpi_simple_debugger import system_monitor
+from rpi_simple_debugger.system_monitor import SystemMonitor
+from rpi_simple_debugger.models import SystemHealth
 
-    def on_update(health: SystemHealth) -> None:
-        collected_health.append(health)
 
-    monitor = SystemMonitor(interval_s=0.1, on_update=on_update)
+@pytest.fixture(scope="module")
+def health() -> SystemHealth:
+    """One real health reading, shared by the read-only collection tests.
 
+    Collecting walks the whole process table, so it is done once per module.
+    """
+    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
     # Directly call _get_health to test collection without threading
-    health = monitor._get_health()
+    return monitor._get_health()
+
 
+def test_system_monitor_collects_health(health: SystemHealth) -> None:
+    """SystemMonitor should collect system health data."""
     assert isinstance(health, SystemHealth)
     assert health.cpu_percent >= 0
     assert health.disk_used_percent >= 0
@@ -24,11 +30,8 @@ def test_system_monitor_collects_health() -> None:
     assert health.memory_percent >= 0
 
 
-def test_system_monitor_health_fields() -> None:
+def test_system_monitor_health_fields(health: SystemHealth) -> None:
     """SystemMonitor should populate expected health fields."""
-    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
-    health = monitor._get_health()
-
     # These should always be available
     assert hasattr(health, "cpu_percent")
     assert hasattr(health, "disk_used_percent")
@@ -38,11 +41,8 @@ def test_system_monitor_health_fields() -> None:
     assert hasattr(health, "top_processes")
 
 
-def test_system_monitor_top_processes() -> None:
+def test_system_monitor_top_processes(health: SystemHealth) -> None:
     """SystemMonitor should collect top processes."""
-    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
-    health = monitor._get_health()
-
     # top_processes should be populated (may be None on some systems)
     if health.top_processes is not None:
         assert isinstance(health.top_processes, list)
@@ -52,21 +52,25 @@ def test_system_monitor_top_processes() -> None:
             assert proc.pid > 0
 
 
-def test_system_monitor_start_stop() -> None:
+@pytest.mark.slow
+def test_system_monitor_start_stop(stub_collectors) -> None:
     """SystemMonitor should start and stop without errors."""
     collected = []
+    reported = threading.Event()
 
     def on_update(health: SystemHealth) -> None:
         collected.append(health)
+        reported.set()
 
     monitor = SystemMonitor(interval_s=0.05, on_update=on_update)
+    # Collection is covered by the direct tests above; only exercise the thread.
+    stub_collectors(monitor)
 
     # Start monitoring
     monitor.start()
 
-    # Wait a bit for at least one collection
-    import time
-    time.sleep(0.15)
+    # Wait for the first collection
+    assert reported.wait(timeout=2.0)
 
     # Stop monitoring
     monitor.stop()
@@ -75,17 +79,86 @@ def test_system_monitor_start_stop() -> None:
     assert len(collected) >= 1
 
 
-def test_system_monitor_double_start() -> None:
+@pytest.mark.slow
+@pytest.mark.parametrize("running_monitor", ["system"], indirect=True)
+def test_system_monitor_double_start(running_monitor) -> None:
     """Starting monitor twice should not create multiple threads."""
+    thread = running_monitor._thread
+
+    running_monitor.start()  # Second start
+
+    # Should be the same thread
+    assert running_monitor._thread is thread
+
+
+def test_system_monitor_reads_boot_time_once(monkeypatch) -> None:
+    """psutil.boot_time should be read on the first tick only."""
+    calls = []
+    monkeypatch.setattr(
+        system_monitor.psutil, "boot_time", lambda: calls.append(1) or 1000.0
+    )
     monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
 
-    monitor.start()
-    thread1 = monitor._thread
+    first = monitor._get_health()
+    second = monitor._get_health()
 
-    monitor.start()  # Second start
-    thread2 = monitor._thread
+    assert len(calls) == 1
+    assert first.boot_time == second.boot_time == 1000.0
+    assert second.uptime_s >= first.uptime_s
 
-    # Should be the same thread
-    assert thread1 is thread2
 
+def test_system_monitor_reads_cpu_thermal_zone(tmp_path, monkeypatch) -> None:
+    """CPU temperature should come from the discovered thermal zone file."""
+    zones = [("gpu-thermal", "40000"), ("cpu-thermal", "48312")]
+    for index, (zone_type, temp) in enumerate(zones):
+        zone = tmp_path / f"thermal_zone{index}"
+        zone.mkdir()
+        (zone / "type").write_text(zone_type + "\n")
+        (zone / "temp").write_text(temp + "\n")
+    monkeypatch.setattr(system_monitor, "_THERMAL_ROOT", tmp_path)
+
+    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
+
+    assert monitor._get_cpu_temp() == 48.312
+    assert monitor._thermal_path == tmp_path / "thermal_zone1" / "temp"
+
+
+def test_system_monitor_orders_thermal_zones_numerically(tmp_path, monkeypatch) -> None:
+    """thermal_zone2 should be checked before thermal_zone10."""
+    for index, zone_type in ((10, "cpu-thermal"), (2, "soc-thermal")):
+        zone = tmp_path / f"thermal_zone{index}"
+        zone.mkdir()
+        (zone / "type").write_text(zone_type + "\n")
+        (zone / "temp").write_text("45000\n")
+    monkeypatch.setattr(system_monitor, "_THERMAL_ROOT", tmp_path)
+
+    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
+
+    assert monitor._find_cpu_thermal_zone() == tmp_path / "thermal_zone2" / "temp"
+
+
+def test_system_monitor_stop_does_not_wait_for_interval(stub_collectors) -> None:
+    """stop() should interrupt the wait between ticks."""
+    ticked = threading.Event()
+    monitor = stub_collectors(
+        SystemMonitor(interval_s=60.0, on_update=lambda h: ticked.set())
+    )
+
+    monitor.start()
+    assert ticked.wait(5.0)
+    # The loop is now in its 60 s wait; stop()'s join would time out
+    # unless stop() interrupts it.
     monitor.stop()
+
+    assert not monitor._thread.is_alive()
+
+
+def test_system_monitor_reads_uptime_from_proc(tmp_path, monkeypatch) -> None:
+    """Uptime should come from /proc/uptime when it is readable."""
+    uptime = tmp_path / "uptime"
+    uptime.write_text("12345.67 54321.00\n")
+    monkeypatch.setattr(system_monitor, "_PROC_UPTIME", uptime)
+
+    monitor = SystemMonitor(interval_s=0.1, on_update=lambda h: None)
+
+    assert monitor._get_health().uptime_s == 12345.67
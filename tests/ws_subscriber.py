@@ -7,51 +7,148 @@ from GPIO, WiFi, Bluetooth, and system health monitors.
 
 import asyncio
 import json
-from datetime import datetime
-from typing import Any, Dict
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
 
 try:
     import websockets
 except ImportError:
-    print("Installing websockets library...")
-    import subprocess
-    import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "websockets"])
-    import websockets
+    sys.exit(
+        "ws_subscriber needs the websockets library. Install it with:\n"
+        "  pip install 'rpi-simple-debugger[subscriber]'"
+    )
+
+# orjson is optional; it decodes frames several times faster than json.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so one except covers both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    loads = json.loads
+
+    def dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Wall-clock prefix for each printed line; milliseconds are appended.
+_TIME_FORMAT = "%H:%M:%S"
+# Lines arriving within this window are written to stdout together.
+_FLUSH_INTERVAL_S = 0.05
+
+# The formatted local time only changes once a second, so it is reused for
+# every message within that second; only the milliseconds are recomputed.
+_last_second = -1
+_last_prefix = ""
+
+
+def _timestamp() -> str:
+    """Return the current local time as ``HH:MM:SS.mmm``."""
+    global _last_second, _last_prefix
+    now_ms = time.time_ns() // 1_000_000
+    second, millis = divmod(now_ms, 1000)
+    if second != _last_second:
+        _last_prefix = time.strftime(_TIME_FORMAT, time.localtime(second))
+        _last_second = second
+    return f"{_last_prefix}.{millis:03d}"
+
+
+def _fmt_gpio(timestamp: str, data: Dict[str, Any]) -> str:
+    pin = data.get("pin", "?")
+    value = data.get("value", "?")
+    label = data.get("label", "")
+    label_str = f" ({label})" if label else ""
+    return f"[{timestamp}] GPIO: Pin {pin}{label_str} = {value}"
+
+
+def _fmt_wifi(timestamp: str, data: Dict[str, Any]) -> str:
+    ssid = data.get("ssid") or "N/A"
+    connected = data.get("connected", False)
+    signal = data.get("signal_level_dbm")
+    signal_str = f"{signal} dBm" if signal is not None else "N/A"
+    return f"[{timestamp}] WiFi: {ssid} | Connected: {connected} | Signal: {signal_str}"
+
+
+def _fmt_bluetooth(timestamp: str, data: Dict[str, Any]) -> str:
+    powered = data.get("powered", False)
+    connected = data.get("connected", False)
+    return f"[{timestamp}] Bluetooth: Powered: {powered} | Connected: {connected}"
+
+
+def _fmt_system(timestamp: str, data: Dict[str, Any]) -> str:
+    cpu = data.get("cpu_percent", "N/A")
+    mem = data.get("memory_percent")
+    temp = data.get("cpu_temp_c")
+    mem_str = f"{mem}%" if mem is not None else "N/A"
+    temp_str = f"{temp}°C" if temp is not None else "N/A"
+    return f"[{timestamp}] System: CPU: {cpu}% | Memory: {mem_str} | Temp: {temp_str}"
+
+
+_FORMATTERS: Dict[str, Callable[[str, Dict[str, Any]], str]] = {
+    "gpio": _fmt_gpio,
+    "wifi": _fmt_wifi,
+    "bluetooth": _fmt_bluetooth,
+    "system": _fmt_system,
+}
 
 
 def format_message(msg: Dict[str, Any]) -> str:
     """Format a message for pretty printing."""
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = _timestamp()
     msg_type = msg.get("type", "unknown")
     data = msg.get("data", {})
-    
-    if msg_type == "gpio":
-        pin = data.get("pin", "?")
-        value = data.get("value", "?")
-        label = data.get("label", "")
-        label_str = f" ({label})" if label else ""
-        return f"[{timestamp}] GPIO: Pin {pin}{label_str} = {value}"
-    
-    elif msg_type == "wifi":
-        ssid = data.get("ssid", "N/A")
-        connected = data.get("connected", False)
-        signal = data.get("signal_strength", "N/A")
-        return f"[{timestamp}] WiFi: {ssid} | Connected: {connected} | Signal: {signal}"
-    
-    elif msg_type == "bluetooth":
-        enabled = data.get("enabled", False)
-        devices = data.get("connected_devices", [])
-        return f"[{timestamp}] Bluetooth: Enabled: {enabled} | Devices: {len(devices)}"
-    
-    elif msg_type == "system":
-        cpu = data.get("cpu_percent", "N/A")
-        mem = data.get("memory_percent", "N/A")
-        temp = data.get("temperature_c", "N/A")
-        return f"[{timestamp}] System: CPU: {cpu}% | Memory: {mem}% | Temp: {temp}°C"
-    
-    else:
-        return f"[{timestamp}] {msg_type.upper()}: {json.dumps(data, indent=2)}"
+
+    formatter = _FORMATTERS.get(msg_type)
+    if formatter is not None:
+        return formatter(timestamp, data)
+    return f"[{timestamp}] {msg_type.upper()}: {dumps_pretty(data)}"
+
+
+def render_message(message: Any, raw: bool = False) -> str:
+    """Turn one WebSocket frame into the text to print."""
+    try:
+        data = loads(message)
+        if raw:
+            # Print raw JSON with pretty formatting
+            timestamp = _timestamp()
+            return f"[{timestamp}] {dumps_pretty(data)}"
+        return format_message(data)
+    except json.JSONDecodeError:
+        return f"[RAW] {message}"
+    except Exception as e:
+        return f"[ERROR] Failed to process message: {e}\n[RAW] {message}"
+
+
+async def _print_batches(queue: "asyncio.Queue[Optional[str]]") -> None:
+    """Write queued lines to stdout, one write per ``_FLUSH_INTERVAL_S``.
+
+    A ``None`` entry marks the end of the stream.
+    """
+    while True:
+        # Block while idle; once a line arrives, let a burst accumulate.
+        first = await queue.get()
+        if first is None:
+            return
+        await asyncio.sleep(_FLUSH_INTERVAL_S)
+        batch = [first]
+        done = False
+        while not queue.empty():
+            line = queue.get_nowait()
+            if line is None:
+                done = True
+                break
+            batch.append(line)
+        sys.stdout.write("\n".join(batch) + "\n")
+        sys.stdout.flush()
+        if done:
+            return
 
 
 async def subscribe(url: str = "ws://localhost:8000/ws", raw: bool = False):
@@ -63,21 +160,16 @@ async def subscribe(url: str = "ws://localhost:8000/ws", raw: bool = False):
             print(f"Connected! Listening for updates...\n")
             print("=" * 80)
             
-            async for message in websocket:
-                try:
-                    data = json.loads(message)
-                    if raw:
-                        # Print raw JSON with pretty formatting
-                        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                        print(f"[{timestamp}] {json.dumps(data, indent=2)}")
-                    else:
-                        formatted = format_message(data)
-                        print(formatted)
-                except json.JSONDecodeError:
-                    print(f"[RAW] {message}")
-                except Exception as e:
-                    print(f"[ERROR] Failed to process message: {e}")
-                    print(f"[RAW] {message}")
+            # Reading frames never waits on the terminal; a separate task
+            # prints whatever has queued up in batches.
+            queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+            printer = asyncio.create_task(_print_batches(queue))
+            try:
+                async for message in websocket:
+                    queue.put_nowait(render_message(message, raw))
+            finally:
+                queue.put_nowait(None)
+                await printer
     
     except websockets.exceptions.WebSocketException as e:
         print(f"\n❌ WebSocket error: {e}")